@@ -43,6 +43,46 @@ level1_color = '@*g'
 level2_color = '@*r'
 plain_format = '@.'
 
+#: Valid values of the "order" keyword of a chained experiment
+chain_orders = ['after_chain', 'after_root', 'before_chain', 'before_root']
+
+#: Compiled application regexes, keyed by pattern string
+_compiled_regexes = {}
+
+
+def _compile_regex(regex, compiled=None):
+    """Compile a regular expression, unless its definition was compiled
+
+    Patterns come from application definitions, so each one is only
+    compiled once, the first time experiments are analyzed with it.
+    """
+    if compiled is not None:
+        return compiled
+    compiled = _compiled_regexes.get(regex)
+    if compiled is None:
+        compiled = re.compile(regex)
+        _compiled_regexes[regex] = compiled
+    return compiled
+
+
+def _copy_data(data):
+    """Deep copy configuration data made of dicts, lists, and immutable values
+
+    This is much cheaper than copy.deepcopy, as it only walks containers and
+    shares everything else.
+    """
+    if isinstance(data, (dict, list)) and not data:
+        # Empty containers are common, and need no recursion
+        return type(data)()
+    if isinstance(data, dict):
+        new_data = type(data)()
+        for key, val in data.items():
+            new_data[key] = _copy_data(val)
+        return new_data
+    if isinstance(data, list):
+        return type(data)(_copy_data(val) for val in data)
+    return data
+
 
 def section_title(s):
     return header_color + s + plain_format
@@ -63,14 +103,16 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
     _builtin_required_key = 'required'
     _workload_exec_key = 'executables'
 
+    # Pipeline phases are shared by all instances of a class, so they are
+    # tuples to keep them from being modified through an instance.
+    _setup_phases = ()
+    _analyze_phases = ()
+    _archive_phases = ('archive_experiments',)
+    _mirror_phases = ('mirror_inputs',)
+
     def __init__(self, file_path):
         super().__init__()
 
-        self._setup_phases = []
-        self._analyze_phases = []
-        self._archive_phases = ['archive_experiments']
-        self._mirror_phases = ['mirror_inputs']
-
         self._vars_are_expanded = False
         self.expander = None
         self.variables = None
@@ -83,6 +125,7 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
         self.chain_append = []
         self.chain_commands = {}
         self._env_variable_sets = None
+        self._required_builtins = None
 
         self._file_path = file_path
 
@@ -95,26 +138,40 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
         """Deep copy an application instance"""
         new_copy = type(self)(self._file_path)
 
-        new_copy.set_env_variable_sets(self._env_variable_sets.copy())
+        # set_env_variable_sets shares the sets it is given, so give the copy
+        # its own
+        new_copy.set_env_variable_sets(_copy_data(self._env_variable_sets))
         new_copy.set_variables(self.variables.copy(), self.experiment_set)
-        new_copy.set_internals(self.internals.copy())
+        new_copy.set_internals(_copy_data(self.internals))
         new_copy.set_template(False)
         new_copy.set_chained_experiments(None)
 
         return new_copy
 
+    @property
+    def required_builtins(self):
+        """Names of builtins injected into every workload, in definition order
+
+        Builtins are defined by directives on the class, so this is only
+        computed once per instance.
+        """
+        if self._required_builtins is None:
+            self._required_builtins = tuple(
+                builtin for builtin, blt_conf in self.builtins.items()
+                if blt_conf[self._builtin_required_key]
+            )
+        return self._required_builtins
+
     def _inject_required_builtins(self):
-        required_builtins = []
-        for builtin, blt_conf in self.builtins.items():
-            if blt_conf[self._builtin_required_key]:
-                required_builtins.append(builtin)
+        required_builtins = self.required_builtins
 
         for workload, wl_conf in self.workloads.items():
             if self._workload_exec_key in wl_conf:
-                # Insert in reverse order, to make sure they are correctly ordered.
-                for builtin in reversed(required_builtins):
-                    if builtin not in wl_conf[self._workload_exec_key]:
-                        wl_conf[self._workload_exec_key].insert(0, builtin)
+                wl_execs = wl_conf[self._workload_exec_key]
+                existing = set(wl_execs)
+                # Prepend all missing builtins at once, preserving their order.
+                wl_execs[:0] = [builtin for builtin in required_builtins
+                                if builtin not in existing]
 
     def _long_print(self):
         out_str = []
@@ -171,9 +228,13 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
         return out_str
 
     def set_env_variable_sets(self, env_variable_sets):
-        """Set internal reference to environment variable sets"""
+        """Set internal reference to environment variable sets
+
+        The sets are only read, so they are shared with the caller instead of
+        being copied for every experiment. copy() gives its copy its own sets.
+        """
 
-        self._env_variable_sets = env_variable_sets.copy()
+        self._env_variable_sets = env_variable_sets
 
     def set_variables(self, variables, experiment_set):
         """Set internal reference to variables
@@ -204,7 +265,7 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
     def get_pipeline_phases(self, pipeline):
         phases = []
         if hasattr(self, '_%s_phases' % pipeline):
-            phases = getattr(self, '_%s_phases' % pipeline).copy()
+            phases = list(getattr(self, '_%s_phases' % pipeline))
         return phases
 
     def _short_print(self):
@@ -276,17 +337,15 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
         var_set_orig = var_set.copy()
 
         for append_group in var_conf:
-            sep = ' '
-            if 'var-separator' in append_group:
-                sep = append_group['var-separator']
+            sep = append_group.get('var-separator', ' ')
 
-            for group in append_funcs.keys():
-                if group in append_group.keys():
+            for group, append_func in append_funcs.items():
+                if group in append_group:
                     for var, val in append_group[group].items():
                         if var not in var_set:
                             env_mods.set(var, '${%s}' % var)
                             var_set.add(var)
-                        append_funcs[group](var, val, sep=sep)
+                        append_func(var, val, sep=sep)
 
         env_cmds_arr = env_mods.shell_modifications(shell=shell, explicit=True)
 
@@ -302,12 +361,13 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
         var_set_orig = var_set.copy()
 
         for prepend_group in var_conf:
-            for group in prepend_group.keys():
-                for var, val in prepend_group[group].items():
+            for group, group_vars in prepend_group.items():
+                prepend_func = prepend_funcs[group]
+                for var, val in group_vars.items():
                     if var not in var_set:
                         env_mods.set(var, '${%s}' % var)
                         var_set.add(var)
-                    prepend_funcs[group](var, val)
+                    prepend_func(var, val)
 
         env_cmds_arr = env_mods.shell_modifications(shell=shell, explicit=True)
 
@@ -359,15 +419,14 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
                                         '    "name" keyword must be defined')
 
             if 'order' in cur_exp_def:
-                possible_orders = ['after_chain', 'after_root', 'before_chain', 'before_root']
-                if cur_exp_def['order'] not in possible_orders:
+                if cur_exp_def['order'] not in chain_orders:
                     raise InvalidChainError('Invalid experiment chain defined:\n' +
                                             f'    Primary experiment {parent_namespace}\n' +
                                             f'    Chain definition: {str(exp)}\n' +
                                             '    Optional keyword "order" must ' +
-                                            f'be one of {str(possible_orders)}\n')
+                                            f'be one of {str(chain_orders)}\n')
 
-            if 'command' not in cur_exp_def.keys():
+            if 'command' not in cur_exp_def:
                 raise InvalidChainError('Invalid experiment chain defined:\n' +
                                         f'    Primary experiment {parent_namespace}\n' +
                                         f'    Chain definition: {str(exp)}\n' +
@@ -415,8 +474,7 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
                     new_inst = base_inst.copy()
 
                     if namespace.variables in cur_exp_def:
-                        for var, val in cur_exp_def[namespace.variables].items():
-                            new_inst.variables[var] = val
+                        new_inst.variables.update(cur_exp_def[namespace.variables])
 
                     new_inst.expander._experiment_namespace = new_name
                     new_inst.variables[keywords.experiment_run_dir] = new_run_dir
@@ -791,7 +849,10 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
             tty.debug('Reading log file: %s' % file)
 
             with open(file, 'r') as f:
-                for line in f.readlines():
+                for line in f:
+                    # Contexts and foms often share a regex, so each distinct
+                    # regex is only matched once per line.
+                    line_matches = {}
 
                     for criteria in file_conf['success_criteria']:
                         tty.debug('Looking for criteria %s' % criteria)
@@ -801,7 +862,10 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
 
                     for context in file_conf['contexts']:
                         context_conf = contexts[context]
-                        context_match = context_conf['regex'].match(line)
+                        context_regex = context_conf['regex']
+                        if context_regex not in line_matches:
+                            line_matches[context_regex] = context_regex.match(line)
+                        context_match = line_matches[context_regex]
 
                         if context_match:
                             context_name = \
@@ -816,11 +880,13 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
 
                     for fom in file_conf['foms']:
                         fom_conf = foms[fom]
-                        fom_match = fom_conf['regex'].match(line)
+                        fom_regex = fom_conf['regex']
+                        if fom_regex not in line_matches:
+                            line_matches[fom_regex] = fom_regex.match(line)
+                        fom_match = line_matches[fom_regex]
 
                         if fom_match and \
-                                (fom_conf['group'] in
-                                 fom_conf['regex'].groupindex):
+                                (fom_conf['group'] in fom_regex.groupindex):
                             tty.debug(' --- Matched fom %s' % fom)
                             fom_contexts = []
                             if fom_conf['contexts']:
@@ -903,9 +969,9 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
         criteria_list.flush_scope('application_definition')
         for criteria, conf in self.success_criteria.items():
             if conf['mode'] == 'string':
+                match = _compile_regex(conf['match'], conf['compiled_match'])
                 criteria_list.add_criteria('application_definition', criteria,
-                                           conf['mode'], re.compile(conf['match']),
-                                           conf['file'])
+                                           conf['mode'], match, conf['file'])
 
         # Extract file paths for all criteria
         for criteria in criteria_list.all_criteria():
@@ -931,7 +997,7 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
                 files[log_path]['foms'].append(fom)
 
             foms[fom] = {
-                'regex': re.compile(r'%s' % conf['regex']),
+                'regex': _compile_regex(conf['regex'], conf['compiled_regex']),
                 'contexts': [],
                 'group': conf['group_name'],
                 'units': conf['units']
@@ -943,10 +1009,12 @@ class ApplicationBase(object, metaclass=ApplicationMeta):
                 for context in conf['contexts']:
                     regex_str = \
                         self.figure_of_merit_contexts[context]['regex']
+                    compiled_regex = \
+                        self.figure_of_merit_contexts[context]['compiled_regex']
                     format_str = \
                         self.figure_of_merit_contexts[context]['output_format']
                     contexts[context] = {
-                        'regex': re.compile(r'%s' % regex_str),
+                        'regex': _compile_regex(regex_str, compiled_regex),
                         'format': format_str
                     }
         return files, contexts, foms
@@ -19,13 +19,13 @@ class ExecutableApplication(ApplicationBase):
     It currently only utilizes phases defined in the base class.
     """
 
-    def __init__(self, file_path):
-        super().__init__(file_path)
-        self._setup_phases = [
-            'get_inputs',
-            'make_experiments'
-        ]
+    _setup_phases = (
+        'get_inputs',
+        'make_experiments'
+    )
 
-        self._analyze_phases = ['analyze_experiments']
+    _analyze_phases = ('analyze_experiments',)
 
+    def __init__(self, file_path):
+        super().__init__(file_path)
         self.application_class = 'ExecutableApplication'
@@ -42,25 +42,25 @@ class SpackApplication(ApplicationBase):
                     ('software_specs', 'Software Specs')]
     _spec_keys = ['spack_spec', 'compiler_spec', 'compiler']
 
+    _setup_phases = (
+        'install_compilers',
+        'create_spack_env',
+        'install_software',
+        'define_package_paths',
+        'get_inputs',
+        'make_experiments'
+    )
+
+    _analyze_phases = ('analyze_experiments',)
+    _archive_phases = ('archive_experiments',)
+    _mirror_phases = (
+        'mirror_inputs',
+        'create_spack_env',
+        'mirror_software'
+    )
+
     def __init__(self, file_path):
         super().__init__(file_path)
-        self._setup_phases = [
-            'install_compilers',
-            'create_spack_env',
-            'install_software',
-            'define_package_paths',
-            'get_inputs',
-            'make_experiments'
-        ]
-
-        self._analyze_phases = ['analyze_experiments']
-        self._archive_phases = ['archive_experiments']
-        self._mirror_phases = [
-            'mirror_inputs',
-            'create_spack_env',
-            'mirror_software'
-        ]
-
         self.spack_runner = ramble.spack_runner.SpackRunner()
         self.application_class = 'SpackApplication'
 
@@ -6,6 +6,7 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
+import argparse
 import os
 import sys
 import tempfile
@@ -15,18 +16,12 @@ import llnl.util.tty.color as color
 from llnl.util.tty.colify import colify
 
 import spack.util.string as string
-from spack.util.editor import editor
-import spack.util.environment
 
 import ramble.cmd
 import ramble.cmd.common.arguments
 import ramble.cmd.common.arguments as arguments
 
-import ramble.config
 import ramble.workspace
-import ramble.workspace.shell
-import ramble.experiment_set
-import ramble.software_environments
 from ramble.namespace import namespace
 
 if sys.version_info >= (3, 3):
@@ -39,6 +34,10 @@ description = 'manage experiment workspaces'
 section = 'workspaces'
 level = 'short'
 
+#: Buffer size used when reading user provided config and template files,
+#: large enough that typical files are read with a single read call
+file_read_buffer_size = 1024 * 1024
+
 subcommands = [
     'activate',
     'archive',
@@ -54,22 +53,34 @@ subcommands = [
     ['remove', 'rm'],
 ]
 
+#: Map of subcommand aliases to the name of the subcommand they invoke
+subcommand_aliases = dict(
+    (alias, name[0])
+    for name in subcommands if isinstance(name, (list, tuple))
+    for alias in name[1:]
+)
+
+
+#: Shells that workspace (de)activation can print commands for
+shells = ['sh', 'csh', 'fish', 'bat']
+
+
+def _add_shell_args(group, action):
+    """Add a flag for each supported shell to an argument group
+
+    Arguments:
+        group: argument group (typically mutually exclusive) to add flags to
+        action (str): 'activate' or 'deactivate', used in the help text
+    """
+    for shell in shells:
+        group.add_argument(
+            '--%s' % shell, action='store_const', dest='shell', const=shell,
+            help="print %s commands to %s the workspace" % (shell, action))
+
 
 def workspace_activate_setup_parser(subparser):
     """Set the current workspace"""
-    shells = subparser.add_mutually_exclusive_group()
-    shells.add_argument(
-        '--sh', action='store_const', dest='shell', const='sh',
-        help="print sh commands to activate the workspace")
-    shells.add_argument(
-        '--csh', action='store_const', dest='shell', const='csh',
-        help="print csh commands to activate the workspace")
-    shells.add_argument(
-        '--fish', action='store_const', dest='shell', const='fish',
-        help="print fish commands to activate the workspace")
-    shells.add_argument(
-        '--bat', action='store_const', dest='shell', const='bat',
-        help="print bat commands to activate the environment")
+    _add_shell_args(subparser.add_mutually_exclusive_group(), 'activate')
 
     subparser.add_argument(
         '-p', '--prompt', action='store_true', default=False,
@@ -96,6 +107,9 @@ def create_temp_workspace_directory():
 
 
 def workspace_activate(args):
+    import spack.util.environment
+    import ramble.workspace.shell
+
     if not args.activate_workspace and not args.dir and not args.temp:
         tty.die('ramble workspace activate requires a workspace name, directory, or --temp')
 
@@ -147,28 +161,19 @@ def workspace_activate(args):
     env_mods.extend(ramble.workspace.shell.activate(
         ws=active_workspace
     ))
-    cmds += env_mods.shell_modifications(args.shell)
+    if env_mods:
+        cmds += env_mods.shell_modifications(args.shell)
     sys.stdout.write(cmds)
 
 
 def workspace_deactivate_setup_parser(subparser):
     """deactivate any active workspace in the shell"""
-    shells = subparser.add_mutually_exclusive_group()
-    shells.add_argument(
-        '--sh', action='store_const', dest='shell', const='sh',
-        help="print sh commands to deactivate the workspace")
-    shells.add_argument(
-        '--csh', action='store_const', dest='shell', const='csh',
-        help="print csh commands to deactivate the workspace")
-    shells.add_argument(
-        '--fish', action='store_const', dest='shell', const='fish',
-        help="print fish commands to activate the workspace")
-    shells.add_argument(
-        '--bat', action='store_const', dest='shell', const='bat',
-        help="print bat commands to activate the environment")
+    _add_shell_args(subparser.add_mutually_exclusive_group(), 'deactivate')
 
 
 def workspace_deactivate(args):
+    import ramble.workspace.shell
+
     if not args.shell:
         ramble.cmd.common.shell_init_instructions(
             "ramble workspace deactivate",
@@ -187,7 +192,8 @@ def workspace_deactivate(args):
 
     cmds = ramble.workspace.shell.deactivate_header(args.shell)
     env_mods = ramble.workspace.shell.deactivate()
-    cmds += env_mods.shell_modifications(args.shell)
+    if env_mods:
+        cmds += env_mods.shell_modifications(args.shell)
     sys.stdout.write(cmds)
 
 
@@ -229,28 +235,26 @@ def _workspace_create(name_or_path, dir=False,
 
     if dir:
         workspace = ramble.workspace.Workspace(name_or_path)
-        workspace.write()
-        tty.msg("Created workspace in %s" % workspace.path)
-        tty.msg("You can activate this workspace with:")
-        tty.msg("  ramble workspace activate %s" % workspace.path)
     else:
         workspace = ramble.workspace.create(name_or_path)
-        workspace.write()
-        tty.msg("Created workspace in %s" % name_or_path)
-        tty.msg("You can activate this workspace with:")
-        tty.msg("  ramble workspace activate %s" % name_or_path)
 
     if config:
-        with open(config, 'r') as f:
+        with open(config, 'r', buffering=file_read_buffer_size) as f:
             workspace._read_config('workspace', f)
-            workspace._write_config('workspace')
 
     if template_execute:
-        with open(template_execute, 'r') as f:
+        with open(template_execute, 'r', buffering=file_read_buffer_size) as f:
             _, file_name = os.path.split(template_execute)
             template_name = os.path.splitext(file_name)[0]
             workspace._read_template(template_name, f.read())
-            workspace._write_templates()
+
+    # Write the workspace, with any provided config and template, only once
+    workspace.write()
+
+    activate_name = workspace.path if dir else name_or_path
+    tty.msg("Created workspace in %s" % activate_name)
+    tty.msg("You can activate this workspace with:")
+    tty.msg("  ramble workspace activate %s" % activate_name)
 
     return workspace
 
@@ -269,10 +273,13 @@ def workspace_remove(args):
     This removes an environment managed by Ramble. Directory workspaces
     should be removed manually.
     """
-    read_workspaces = []
+    # Only check that the workspaces exist up front; parsing their
+    # configuration is deferred until the removal has been confirmed.
     for workspace_name in args.rm_wrkspc:
-        workspace = ramble.workspace.read(workspace_name)
-        read_workspaces.append(workspace)
+        ramble.workspace.validate_workspace_name(workspace_name)
+        if not ramble.workspace.exists(workspace_name):
+            raise ramble.workspace.RambleWorkspaceError(
+                "no such workspace '%s'" % workspace_name)
 
     tty.debug('Removal args: {}'.format(args))
 
@@ -285,7 +292,8 @@ def workspace_remove(args):
         if not answer:
             tty.die("Will not remove any workspaces")
 
-    for workspace in read_workspaces:
+    for workspace_name in args.rm_wrkspc:
+        workspace = ramble.workspace.read(workspace_name)
         if workspace.active:
             tty.die("Workspace %s can't be removed while activated."
                     % workspace.name)
@@ -391,6 +399,37 @@ def nested_4(s):
     return level4_color + s + plain_format
 
 
+# Colorized headers printed repeatedly by workspace info, built once
+_application_header = nested_1('  Application: ')
+_workload_header = nested_2('    Workload: ')
+_template_experiment_header = nested_3('      Template Experiment: ')
+_experiment_header = nested_3('      Experiment: ')
+_config_vars_header = nested_4('        Variables from ') + config_title('Config') + ':'
+_workspace_vars_header = nested_4('        Variables from ') + section_title('Workspace') + ':'
+_application_vars_header = nested_4('        Variables from ') + nested_1('Application') + ':'
+_workload_vars_header = nested_4('        Variables from ') + nested_2('Workload') + ':'
+_experiment_vars_header = nested_4('        Variables from ') + nested_3('Experiment') + ':'
+_custom_executables_header = nested_4('        Custom Executables') + ':'
+_executable_order_header = nested_4('        Executable Order') + ': '
+_experiment_chain_header = nested_4('        Experiment Chain') + ':'
+_experiment_chain_item = nested_4('         - ')
+_software_variables_header = nested_3('      Variables:')
+_software_matrices_header = nested_3('      Matrices:')
+_software_matrix_header = nested_3('      Matrix:')
+_software_packages_header = nested_1('  Packages:')
+_software_environments_header = nested_1('  Environments:')
+_rendered_packages_header = nested_3('      Rendered Packages:')
+_rendered_environments_header = nested_3('      Rendered Environments:')
+
+
+def _write_lines(lines):
+    """Colorize and write all buffered lines in a single write, then clear
+    the buffer"""
+    if lines:
+        color.cprint('\n'.join(lines))
+        lines.clear()
+
+
 def workspace_info_setup_parser(subparser):
     """Information about a workspace"""
     subparser.add_argument('-v', '--verbose', action='count', default=0,
@@ -399,23 +438,34 @@ def workspace_info_setup_parser(subparser):
 
 
 def workspace_info(args):
+    import ramble.config
+    import ramble.experiment_set
+    import ramble.software_environments
+
     ws = ramble.cmd.require_active_workspace(cmd_name='workspace info')
 
-    color.cprint(section_title('Workspace: ') + ws.name)
-    color.cprint('')
-    color.cprint(section_title('Location: ') + ws.path)
-    color.cprint('')
+    # Output lines are buffered, and written out once per section
+    out = []
+
+    out.append(section_title('Workspace: ') + ws.name)
+    out.append('')
+    out.append(section_title('Location: ') + ws.path)
+    out.append('')
 
     # Print workspace templates that currently exist
-    color.cprint(section_title('Workspace Templates:'))
+    out.append(section_title('Workspace Templates:'))
     for template, _ in ws.all_templates():
-        color.cprint('    %s' % template)
+        out.append('    %s' % template)
+
+    _write_lines(out)
 
     # Print workspace variables information
     workspace_vars = ws.get_workspace_vars()
+    config_vars = ramble.config.config.get('config:variables')
 
-    # Build experiment set
+    # Build experiment set, recording the experiments each context generates
     experiment_set = ramble.experiment_set.ExperimentSet(ws)
+    experiment_blocks = []
     for app, workloads, app_vars, app_env_vars, app_internals, app_template, app_chained_exps \
             in ws.all_applications():
         for workload, experiments, workload_vars, workload_env_vars, workload_internals, \
@@ -427,6 +477,7 @@ def workspace_info(args):
                 experiment_set.set_workload_context(workload, workload_vars,
                                                     workload_env_vars, workload_internals,
                                                     workload_template, workload_chained_exps)
+                num_experiments = len(experiment_set.experiment_order)
                 experiment_set.set_experiment_context(exp,
                                                       exp_vars,
                                                       exp_env_vars,
@@ -434,180 +485,175 @@ def workspace_info(args):
                                                       exp_internals,
                                                       exp_template,
                                                       exp_chained_exps)
+                experiment_blocks.append((app, workload, app_vars, workload_vars, exp_vars,
+                                          experiment_set.experiment_order[num_experiments:]))
     experiment_set.build_experiment_chains()
 
     # Print experiment information
-    color.cprint('')
-    color.cprint(section_title('Experiments:'))
-    for app, workloads, app_vars, app_env_vars, app_internals, app_template, app_chained_exps \
-            in ws.all_applications():
-        for workload, experiments, workload_vars, workload_env_vars, workload_internals, \
-                workload_template, workload_chained_exps in ws.all_workloads(workloads):
-            for exp, _, exp_vars, exp_env_vars, exp_matrices, exp_internals, exp_template, \
-                    exp_chained_exps in ws.all_experiments(experiments):
-                print_experiment_set = ramble.experiment_set.ExperimentSet(ws)
-                print_experiment_set.set_application_context(app, app_vars,
-                                                             app_env_vars, app_internals,
-                                                             app_template, app_chained_exps)
-                print_experiment_set.set_workload_context(workload, workload_vars,
-                                                          workload_env_vars, workload_internals,
-                                                          workload_template, workload_chained_exps)
-                print_experiment_set.set_experiment_context(exp,
-                                                            exp_vars,
-                                                            exp_env_vars,
-                                                            exp_matrices,
-                                                            exp_internals,
-                                                            exp_template,
-                                                            exp_chained_exps)
-
-                print_experiment_set.build_experiment_chains()
-
-                color.cprint(nested_1('  Application: ') + app)
-                color.cprint(nested_2('    Workload: ') + workload)
-
-                for exp_name, _ in print_experiment_set.all_experiments():
-                    app_inst = experiment_set.get_experiment(exp_name)
-                    if app_inst.is_template:
-                        color.cprint(nested_3('      Template Experiment: ') + exp_name)
-                    else:
-                        color.cprint(nested_3('      Experiment: ') + exp_name)
-
-                    if args.verbose >= 1:
-                        config_vars = ramble.config.config.get('config:variables')
-                        if config_vars:
-                            color.cprint(nested_4('        Variables from ') +
-                                         config_title('Config') + ':')
-                            for var, val in config_vars.items():
-                                expanded = app_inst.expander.expand_var('{' + var + '}')
-                                color.cprint(
-                                    f'          {var} = {val} ==> {expanded}'.replace('@',
-                                                                                      '@@'))
-
-                        if workspace_vars:
-                            color.cprint(nested_4('        Variables from ') +
-                                         section_title('Workspace') + ':')
-                            for var, val in workspace_vars.items():
-                                expanded = app_inst.expander.expand_var('{' + var + '}')
-                                color.cprint(
-                                    f'          {var} = {val} ==> {expanded}'.replace('@',
-                                                                                      '@@'))
-
-                        if app_vars:
-                            color.cprint(nested_4('        Variables from ') +
-                                         nested_1('Application') + ':')
-                            for var, val in app_vars.items():
-                                expanded = app_inst.expander.expand_var('{' + var + '}')
-                                color.cprint(
-                                    f'          {var} = {val} ==> {expanded}'.replace('@',
-                                                                                      '@@'))
-
-                        if workload_vars:
-                            color.cprint(nested_4('        Variables from ') +
-                                         nested_2('Workload') + ':')
-                            for var, val in workload_vars.items():
-                                expanded = app_inst.expander.expand_var('{' + var + '}')
-                                color.cprint(
-                                    f'          {var} = {val} ==> {expanded}'.replace('@',
-                                                                                      '@@'))
-
-                        if exp_vars:
-                            color.cprint(nested_4('        Variables from ') +
-                                         nested_3('Experiment') + ':')
-                            for var, val in exp_vars.items():
-                                expanded = app_inst.expander.expand_var('{' + var + '}')
-                                color.cprint(
-                                    f'          {var} = {val} ==> {expanded}'.replace('@',
-                                                                                      '@@'))
-
-                        if app_inst.internals:
-                            if ramble.workspace.namespace.custom_executables in app_inst.internals:
-                                color.cprint(nested_4('        Custom Executables') + ':')
-                                for name in app_inst.internals[
-                                        ramble.workspace.namespace.custom_executables]:
-
-                                    color.cprint(f'          {name}')
-                            if ramble.workspace.namespace.executables in app_inst.internals:
-                                color.cprint(nested_4('        Executable Order') + ': ' +
-                                             str(app_inst.internals['executables']))
-
-                        if app_inst.chain_order:
-                            color.cprint(nested_4('        Experiment Chain') + ':')
-                            for exp in app_inst.chain_order:
-                                color.cprint(nested_4('         - ') + exp)
+    out.append('')
+    out.append(section_title('Experiments:'))
+    for app, workload, app_vars, workload_vars, exp_vars, exp_names in experiment_blocks:
+        # Each block lists its primary experiments, followed by the chained
+        # experiments whose parent and base are both primary experiments
+        # of the block. Chained names have the form:
+        # <parent>.chain.<chain_idx>.<base>
+        block_exps = set(exp_names)
+        chained_names = set()
+        for exp_name in exp_names:
+            chain_prefix = f'{exp_name}.chain.'
+            for chained_name in experiment_set.get_experiment(exp_name).chain_order:
+                if chained_name.startswith(chain_prefix):
+                    base_name = chained_name[len(chain_prefix):].split('.', 1)[1]
+                    if base_name in block_exps:
+                        chained_names.add(chained_name)
+        block_names = exp_names + [exp_name for exp_name in experiment_set.chained_order
+                                   if exp_name in chained_names]
+
+        out.append(_application_header + app)
+        out.append(_workload_header + workload)
+
+        for exp_name in block_names:
+            app_inst = experiment_set.get_experiment(exp_name)
+            if app_inst.is_template:
+                out.append(_template_experiment_header + exp_name)
+            else:
+                out.append(_experiment_header + exp_name)
+
+            if args.verbose >= 1:
+                var_names = set()
+                for var_dict in [config_vars, workspace_vars, app_vars, workload_vars, exp_vars]:
+                    if var_dict:
+                        var_names.update(var_dict.keys())
+                expanded_vars = app_inst.expander.expand_vars(var_names)
+
+                if config_vars:
+                    out.append(_config_vars_header)
+                    for var, val in config_vars.items():
+                        expanded = expanded_vars[var]
+                        out.append(
+                            f'          {var} = {val} ==> {expanded}'.replace('@', '@@'))
+
+                if workspace_vars:
+                    out.append(_workspace_vars_header)
+                    for var, val in workspace_vars.items():
+                        expanded = expanded_vars[var]
+                        out.append(
+                            f'          {var} = {val} ==> {expanded}'.replace('@', '@@'))
+
+                if app_vars:
+                    out.append(_application_vars_header)
+                    for var, val in app_vars.items():
+                        expanded = expanded_vars[var]
+                        out.append(
+                            f'          {var} = {val} ==> {expanded}'.replace('@', '@@'))
+
+                if workload_vars:
+                    out.append(_workload_vars_header)
+                    for var, val in workload_vars.items():
+                        expanded = expanded_vars[var]
+                        out.append(
+                            f'          {var} = {val} ==> {expanded}'.replace('@', '@@'))
+
+                if exp_vars:
+                    out.append(_experiment_vars_header)
+                    for var, val in exp_vars.items():
+                        expanded = expanded_vars[var]
+                        out.append(
+                            f'          {var} = {val} ==> {expanded}'.replace('@', '@@'))
+
+                if app_inst.internals:
+                    if ramble.workspace.namespace.custom_executables in app_inst.internals:
+                        out.append(_custom_executables_header)
+                        for name in app_inst.internals[
+                                ramble.workspace.namespace.custom_executables]:
+
+                            out.append(f'          {name}')
+                    if ramble.workspace.namespace.executables in app_inst.internals:
+                        out.append(_executable_order_header +
+                                   str(app_inst.internals['executables']))
+
+                if app_inst.chain_order:
+                    out.append(_experiment_chain_header)
+                    for exp in app_inst.chain_order:
+                        out.append(_experiment_chain_item + exp)
+
+    _write_lines(out)
 
     # Print software stack information
-    color.cprint('')
-    color.cprint(section_title('Software Stack:'))
+    out.append('')
+    out.append(section_title('Software Stack:'))
 
     software_environments = ramble.software_environments.SoftwareEnvironments(ws)
 
-    color.cprint(nested_1('  Packages:'))
+    out.append(_software_packages_header)
     for raw_pkg in software_environments.all_raw_packages():
-        color.cprint(nested_2(f'    {raw_pkg}:'))
+        out.append(nested_2(f'    {raw_pkg}:'))
 
         pkg_info = software_environments.raw_package_info(raw_pkg)
 
         if args.verbose >= 1:
             if namespace.variables in pkg_info and pkg_info[namespace.variables]:
-                color.cprint(nested_3('      Variables:'))
+                out.append(_software_variables_header)
                 for var, val in pkg_info[namespace.variables].items():
-                    color.cprint(f'        {var} = {val}')
+                    out.append(f'        {var} = {val}')
 
             if namespace.matrices in pkg_info and pkg_info[namespace.matrices]:
-                color.cprint(nested_3('      Matrices:'))
+                out.append(_software_matrices_header)
                 for matrix in pkg_info[namespace.matrices]:
                     base_str = '        - '
                     for var in matrix:
-                        color.cprint(f'{base_str}- {var}')
+                        out.append(f'{base_str}- {var}')
                         base_str = '          '
 
             if namespace.matrix in pkg_info and pkg_info[namespace.matrix]:
-                color.cprint(nested_3('      Matrix:'))
+                out.append(_software_matrix_header)
                 for var in pkg_info[namespace.matrix]:
-                    color.cprint(f'        - {var}')
+                    out.append(f'        - {var}')
 
-        color.cprint(nested_3('      Rendered Packages:'))
+        out.append(_rendered_packages_header)
         for pkg in software_environments.mapped_packages(raw_pkg):
-            color.cprint(nested_4(f'        {pkg}:'))
+            out.append(nested_4(f'        {pkg}:'))
             pkg_spec = software_environments.get_spec(pkg)
             spec_str = pkg_spec[namespace.spack_spec].replace('@', '@@')
-            color.cprint(f'          Spack spec: {spec_str}')
+            out.append(f'          Spack spec: {spec_str}')
             if namespace.compiler_spec in pkg_spec and pkg_spec[namespace.compiler_spec]:
                 spec_str = pkg_spec[namespace.compiler_spec].replace('@', '@@')
-                color.cprint(f'          Compiler spec: {spec_str}')
+                out.append(f'          Compiler spec: {spec_str}')
             if namespace.compiler in pkg_spec and pkg_spec[namespace.compiler]:
-                color.cprint(f'          Compiler: {pkg_spec[namespace.compiler]}')
+                out.append(f'          Compiler: {pkg_spec[namespace.compiler]}')
 
-    color.cprint(nested_1('  Environments:'))
+    out.append(_software_environments_header)
     for raw_env in software_environments.all_raw_environments():
-        color.cprint(nested_2(f'    {raw_env}:'))
+        out.append(nested_2(f'    {raw_env}:'))
 
         env_info = software_environments.raw_environment_info(raw_env)
 
         if args.verbose >= 1:
             if namespace.variables in env_info and env_info[namespace.variables]:
-                color.cprint(nested_3('      Variables:'))
+                out.append(_software_variables_header)
                 for var, val in env_info[namespace.variables].items():
-                    color.cprint(f'        {var} = {val}')
+                    out.append(f'        {var} = {val}')
 
             if namespace.matrices in env_info and env_info[namespace.matrices]:
-                color.cprint(nested_3('      Matrices:'))
+                out.append(_software_matrices_header)
                 for matrix in env_info[namespace.matrices]:
                     base_str = '        - '
                     for var in matrix:
-                        color.cprint(f'{base_str}- {var}')
+                        out.append(f'{base_str}- {var}')
                         base_str = '          '
 
             if namespace.matrix in env_info and env_info[namespace.matrix]:
-                color.cprint(nested_3('      Matrix:'))
+                out.append(_software_matrix_header)
                 for var in env_info[namespace.matrix]:
-                    color.cprint(f'        - {var}')
+                    out.append(f'        - {var}')
 
-        color.cprint(nested_3('      Rendered Environments:'))
+        out.append(_rendered_environments_header)
         for env in software_environments.mapped_environments(raw_env):
-            color.cprint(nested_4(f'        {env} Packages:'))
+            out.append(nested_4(f'        {env} Packages:'))
             for pkg in software_environments.get_env_packages(env):
-                color.cprint(f'          - {pkg}')
+                out.append(f'          - {pkg}')
+
+    _write_lines(out)
 
 
 #
@@ -623,12 +669,6 @@ def workspace_list_setup_parser(subparser):
 def workspace_list(args):
     names = ramble.workspace.all_workspace_names()
 
-    color_names = []
-    for name in names:
-        if ramble.workspace.active(name):
-            name = color.colorize('@*g{%s}' % name)
-        color_names.append(name)
-
     # say how many there are if writing to a tty
     if sys.stdout.isatty():
         if not names:
@@ -636,7 +676,14 @@ def workspace_list(args):
         else:
             tty.msg('%d workspaces' % len(names))
 
-    colify(color_names, indent=4)
+    # highlight the active workspace, which is only visible with color
+    active_workspace = ramble.workspace.active_workspace()
+    if active_workspace and color.get_color_when():
+        active_name = active_workspace.name
+        names = [color.colorize('@*g{%s}' % name) if name == active_name else name
+                 for name in names]
+
+    colify(names, indent=4)
 
 
 def workspace_edit_setup_parser(subparser):
@@ -659,21 +706,22 @@ def workspace_edit_setup_parser(subparser):
 
 
 def workspace_edit(args):
+    from spack.util.editor import editor
+
     ramble_ws = ramble.cmd.find_workspace_path(args)
 
     if not ramble_ws:
         tty.die('ramble workspace edit requires either a command '
                 'line workspace or an active workspace')
 
-    config_file = ramble.workspace.config_file(ramble_ws)
-    template_files = ramble.workspace.all_template_paths(ramble_ws)
-
-    edit_files = [config_file] + template_files
-
+    # Only list the template directory when template files are requested
     if args.config_only:
-        edit_files = [config_file]
+        edit_files = [ramble.workspace.config_file(ramble_ws)]
     elif args.template_only:
-        edit_files = template_files
+        edit_files = ramble.workspace.all_template_paths(ramble_ws)
+    else:
+        edit_files = [ramble.workspace.config_file(ramble_ws)] + \
+            ramble.workspace.all_template_paths(ramble_ws)
 
     if args.print_file:
         for f in edit_files:
@@ -727,13 +775,43 @@ def workspace_mirror(args):
     ws.run_pipeline('mirror')
 
 
-#: Dictionary mapping subcommand names and aliases to functions
-subcommand_functions = {}
+class _LazySubParserMap(dict):
+    """Map of subcommand names to parsers, which defers running a
+    subcommand's setup function until its parser is first looked up.
+
+    argparse only looks up the parser of the subcommand being invoked, so
+    the arguments of every other subcommand are never constructed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.pending_setup = {}
+
+    def __getitem__(self, name):
+        parser = super().__getitem__(name)
+        setup_parser_cmd = self.pending_setup.pop(id(parser), None)
+        if setup_parser_cmd is not None:
+            setup_parser_cmd(parser)
+        return parser
+
+
+class _LazySubParsersAction(argparse._SubParsersAction):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._name_parser_map = self.choices = _LazySubParserMap()
+
+    def add_lazy_parser(self, name, setup_parser_cmd, **kwargs):
+        """Add a stub parser, whose arguments are added by setup_parser_cmd
+        when the parser is first used."""
+        parser = self.add_parser(name, help=setup_parser_cmd.__doc__, **kwargs)
+        self._name_parser_map.pending_setup[id(parser)] = setup_parser_cmd
+        return parser
 
 
 def setup_parser(subparser):
     sp = subparser.add_subparsers(metavar='SUBCOMMAND',
-                                  dest='workspace_command')
+                                  dest='workspace_command',
+                                  action=_LazySubParsersAction)
 
     for name in subcommands:
         if isinstance(name, (list, tuple)):
@@ -741,22 +819,17 @@ def setup_parser(subparser):
         else:
             aliases = []
 
-        # add commands to subcommands dict
-        function_name = 'workspace_%s' % name
-        function = globals()[function_name]
-        for alias in [name] + aliases:
-            subcommand_functions[alias] = function
-
-        # make a subparser and run the command's setup function on it
+        # make a stub subparser, the command's setup function is only run
+        # on it if this subcommand is invoked
         setup_parser_cmd_name = 'workspace_%s_setup_parser' % name
         setup_parser_cmd = globals()[setup_parser_cmd_name]
 
-        subsubparser = sp.add_parser(
-            name, aliases=aliases, help=setup_parser_cmd.__doc__)
-        setup_parser_cmd(subsubparser)
+        sp.add_lazy_parser(name, setup_parser_cmd, aliases=aliases)
 
 
 def workspace(parser, args):
-    """Look for a function called environment_<name> and call it."""
-    action = subcommand_functions[args.workspace_command]
+    """Look for a function called workspace_<name> and call it."""
+    name = subcommand_aliases.get(args.workspace_command,
+                                  args.workspace_command)
+    action = globals()['workspace_%s' % name]
     action(args)
@@ -35,6 +35,7 @@ import contextlib
 import copy
 import functools
 import os
+import pickle
 import re
 import sys
 from contextlib import contextmanager
@@ -180,7 +181,7 @@ class ConfigScope(object):
         data = self.get_section(section)
 
         # We copy data here to avoid adding defaults at write time
-        validate_data = copy.deepcopy(data)
+        validate_data = _copy_config_data(data)
         validate(validate_data, section_schemas[section])
 
         try:
@@ -949,6 +950,20 @@ def _validate_section_name(section):
             % (section, " ".join(section_schemas.keys())))
 
 
+def _copy_config_data(data):
+    """Deep copy YAML configuration data.
+
+    Configuration data only holds plain containers, scalars and the
+    line information attached to them, which round-trip through pickle
+    several times faster than through copy.deepcopy. Anything pickle
+    cannot handle falls back to copy.deepcopy.
+    """
+    try:
+        return pickle.loads(pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return copy.deepcopy(data)
+
+
 def validate(data, schema, filename=None):
     """Validate data read in from a Ramble YAML file.
 
@@ -963,7 +978,7 @@ def validate(data, schema, filename=None):
 
     # validate a copy to avoid adding defaults
     # This allows us to round-trip data without adding to it.
-    test_data = copy.deepcopy(data)
+    test_data = _copy_config_data(data)
 
     if isinstance(test_data, yaml.comments.CommentedMap):
         # HACK to fully copy ruamel CommentedMap that doesn't provide copy
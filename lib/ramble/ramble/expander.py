@@ -167,11 +167,30 @@ class Expander(object):
         expansion variables.
         """
 
-        expansions = self._variables
+        return self._expand(self._expansions(extra_vars), var)
+
+    def expand_vars(self, var_names, extra_vars=None):
+        """Perform expansion of several variables at once
+
+        Expand each named variable, building the dict of expansion
+        variables only once for all of them.
+
+        Returns:
+            (dict): Mapping of each variable name to its expanded value
+        """
+
+        expansions = self._expansions(extra_vars)
+        return {name: self._expand(expansions, self.expansion_str(name))
+                for name in var_names}
+
+    def _expansions(self, extra_vars):
         if extra_vars:
             expansions = self._variables.copy()
             expansions.update(extra_vars)
+            return expansions
+        return self._variables
 
+    def _expand(self, expansions, var):
         expanded = self._partial_expand(expansions, str(var))
 
         if self._fully_expanded(expanded):
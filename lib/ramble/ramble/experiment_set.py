@@ -480,6 +480,10 @@ class ExperimentSet(object):
 
         NOTE: This does not search experiments defined in an experiment chain
         """
+        # Patterns without glob characters can only match a single
+        # experiment, so look it up directly instead of matching every name
+        if not any(c in pattern for c in '*?['):
+            return [pattern] if pattern in self.experiments else []
         return fnmatch.filter(self.experiment_order, pattern)
 
     def get_experiment(self, experiment):
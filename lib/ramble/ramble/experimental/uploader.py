@@ -6,8 +6,75 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
-import llnl.util.tty as tty
+import io
+import os
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import llnl.util.tty as tty
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from google.api_core.exceptions import GoogleAPIError
+except ImportError:
+    # Without the BigQuery client library no client can be created, so there
+    # are no API errors to catch. An empty tuple catches nothing.
+    GoogleAPIError = ()
+
+
+def _dumps(obj, sort_keys=False):
+    """Serialize obj to a JSON string, using orjson when it is available"""
+    if orjson is None:
+        return json.dumps(obj, sort_keys=sort_keys)
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, option=option).decode()
+
+
+#: Maximum number of rows sent in a single BigQuery streaming insert request
+insert_batch_size = 500
+
+#: Tables receiving more rows than this are written with a load job instead
+#: of streaming inserts
+load_job_threshold = 1000
+
+#: Environment variable controlling how many insert requests run concurrently
+concurrency_env_var = 'RAMBLE_BQ_CONCURRENCY'
+
+#: Default number of concurrent insert requests
+default_concurrency = 4
+
+
+def _row_id(*fields):
+    """Stable BigQuery insert id for a row, identified by fields"""
+    key = '::'.join(str(field) for field in fields)
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _upload_concurrency():
+    """Number of concurrent insert requests, read from concurrency_env_var"""
+    value = os.environ.get(concurrency_env_var)
+    if not value:
+        return default_concurrency
+    try:
+        return max(1, int(value))
+    except ValueError:
+        tty.warn("Ignoring invalid {}={}, using {} concurrent uploads".format(
+            concurrency_env_var, value, default_concurrency))
+        return default_concurrency
+
+
+def _chunks(seq, n):
+    """Yield successive slices of seq containing at most n items"""
+    for i in range(0, len(seq), n):
+        yield seq[i:i + n]
 
 
 class Uploader():
@@ -27,58 +94,54 @@ class Experiment():
     '''
     Class representation of experiment data
     '''
+    # Many experiments can be uploaded at once, so avoid a per instance dict.
+    # The order of the slots is the order of the uploaded columns.
+    __slots__ = ('name', 'foms', 'id', 'data', 'application_name',
+                 'workspace_name', 'workload_name', 'bulk_hash', 'n_nodes',
+                 'processes_per_node', 'n_ranks', 'n_threads', 'timestamp')
+
     def __init__(self, name, data, timestamp):
         self.name = name
         self.foms = []
         self.id = None  # This is essentially the hash
         self.data = data
-        self.application_name = data['RAMBLE_VARIABLES']['application_name']
-        self.workspace_name = data['RAMBLE_VARIABLES']['workspace_name']
-        self.workload_name = data['RAMBLE_VARIABLES']['workload_name']
+        ramble_vars = data['RAMBLE_VARIABLES']
+        self.application_name = ramble_vars['application_name']
+        self.workspace_name = ramble_vars['workspace_name']
+        self.workload_name = ramble_vars['workload_name']
         self.bulk_hash = None  # proxy for workspace or "uploaded with"
-        self.n_nodes = data['RAMBLE_VARIABLES']['n_nodes']
-        self.processes_per_node = data['RAMBLE_VARIABLES']['processes_per_node']
-        self.n_ranks = data['RAMBLE_VARIABLES']['n_ranks']
-        self.n_threads = data['RAMBLE_VARIABLES']['n_threads']
+        self.n_nodes = ramble_vars['n_nodes']
+        self.processes_per_node = ramble_vars['processes_per_node']
+        self.n_ranks = ramble_vars['n_ranks']
+        self.n_threads = ramble_vars['n_threads']
         # 'platform' # TODO: add this (it is hard to know without runtime data)
 
         # FIXME: this is no longer strictly needed since it is just a concat of known properties
-        exps_hash = "{workspace_name}::{application}::{workload}::{date}".format(
-            workspace_name=self.workspace_name,
-            application=self.application_name,
-            workload=self.workload_name,
-            date=timestamp
-        )
-
-        self.bulk_hash = exps_hash
+        self.bulk_hash = (f'{self.workspace_name}::{self.application_name}::'
+                          f'{self.workload_name}::{timestamp}')
 
         self.timestamp = str(timestamp)
 
-        self.id = None
-        self.generate_hash()
-
-    def generate_hash(self):
-        # Avoid regenerating a hash when possible
-        # (The hash of an object must never change during its lifetime..)
-        if self.id is None:
-            #  TODO: this might be better as a hash of something we intuatively
-            # expect to be uniqie, like:
-            # "{RAMBLE_STATUS}-{application_name}-{experiment_name}-{time}-etc"
-            # If we don't want this, we can go back to this class just being a dict
-            self.id = hash(self)
-        return self.id
+        # The id is a hash of the experiment's content, so the same
+        # experiment from the same upload always gets the same id. It is
+        # truncated to a signed 64 bit integer to fit an INTEGER column.
+        digest = hashlib.blake2b(f'{self.bulk_hash}::{self.name}'.encode(),
+                                 digest_size=8).digest()
+        self.id = int.from_bytes(digest, 'big', signed=True)
 
     def get_hash(self):
-        return self.generate_hash()
+        return self.id
 
-    def to_json(self):
+    def to_experiment_row(self):
+        """Experiment fields, without the foms which are uploaded to their own table"""
+        j = {attr: getattr(self, attr) for attr in self.__slots__ if attr != 'foms'}
 
-        # deep copy so the assignment below doesn't affect the foms array
-        import copy
-        j = copy.deepcopy(self.__dict__)
+        j['data'] = _dumps(self.data)
+        return j
 
-        j['foms'] = json.dumps(self.foms)
-        j['data'] = json.dumps(self.data)
+    def to_json(self):
+        j = self.to_experiment_row()
+        j['foms'] = _dumps(self.foms)
         return j
 
 
@@ -106,65 +169,72 @@ def format_data(data_in):
     '''
     tty.debug("Format Data in")
     tty.debug(data_in)
-    results = []
 
     # TODO: what is the nice way to deal with the distinction between
     # numberic/float and string FOM values
 
-    from datetime import datetime
     current_dateTime = datetime.now()
 
-    for exp in data_in['experiments']:
-        if exp['RAMBLE_STATUS'] == 'SUCCESS':
-            e = Experiment(exp['name'], exp, current_dateTime)
-            results.append(e)
-            # experiment_id = exp.hash()
-            # 'experiment_id': experiment_id,
-            for context in exp['CONTEXTS']:
-                for fom in context['foms']:
-                    e.foms.append(
-                        {
-                            'name': fom['name'],
-                            'value': fom['value'],
-                            'unit': fom['units'],
-                            'context': context['name'],
-                        }
-                    )
+    results = [Experiment(exp['name'], exp, current_dateTime)
+               for exp in data_in['experiments']
+               if exp.get('RAMBLE_STATUS') == 'SUCCESS']
+
+    for e in results:
+        e.foms = [
+            {
+                'name': fom['name'],
+                'value': fom['value'],
+                'unit': fom['units'],
+                'context': context['name'],
+                'experiment_id': e.id,
+                'experiment_name': e.name,
+            }
+            for context in e.data['CONTEXTS']
+            for fom in context['foms']
+        ]
 
     return results
 
 
 class BigQueryUploader(Uploader):
 
-    def insert_data(self, uri: str, workspace_name, results) -> None:
-        from google.cloud import bigquery
+    def __init__(self):
+        self._client = None
 
-        # TODO: create these tables
-        exp_table_id = "{uri}.{table_name}".format(uri=uri, table_name="experiments")
-        fom_table_id = "{uri}.{table_name}".format(uri=uri, table_name="foms")
+    @property
+    def client(self):
+        """BigQuery client, created on first use and reused afterwards"""
+        if self._client is None:
+            from google.cloud import bigquery
+            self._client = bigquery.Client()
+        return self._client
 
-        client = bigquery.Client()
+    def insert_data(self, uri: str, workspace_name, results) -> None:
+        # TODO: create these tables
+        exp_table_id = f"{uri}.experiments"
+        fom_table_id = f"{uri}.foms"
 
-        exps_to_insert = []
-        foms_to_insert = []
+        client = self.client
 
-        for experiment in results:
-            exps_to_insert.append(experiment.to_json())
+        exps_to_insert = [experiment.to_experiment_row() for experiment in results]
+        foms_to_insert = [fom for experiment in results for fom in experiment.foms]
 
-            for fom in experiment.foms:
-                fom_data = fom
-                fom_data['experiment_id'] = experiment.get_hash()
-                fom_data['experiment_name'] = experiment.name
-                foms_to_insert.append(fom_data)
+        # Row ids let BigQuery deduplicate rows retried within this upload.
+        # Experiment ids include the upload time, so uploading the same
+        # results again produces new ids and new rows.
+        exp_row_ids = [str(experiment.id) for experiment in results]
+        fom_row_ids = [_row_id(fom['experiment_id'], fom['name'], fom['context'])
+                       for fom in foms_to_insert]
 
         tty.debug("Experiments to insert:")
         tty.debug(exps_to_insert)
 
-        # Make an API request.
-        errors1 = client.insert_rows_json(exp_table_id, exps_to_insert)
+        # Make the API requests, foms are only inserted once every
+        # experiment has been inserted successfully.
+        errors1 = self._upload_rows(client, exp_table_id, exps_to_insert, exp_row_ids)
         errors2 = None
         if errors1 == []:
-            errors2 = client.insert_rows_json(fom_table_id, foms_to_insert)
+            errors2 = self._upload_rows(client, fom_table_id, foms_to_insert, fom_row_ids)
 
         for errors, name in zip([errors1, errors2], ['exp', 'fom']):
             if errors == []:
@@ -172,6 +242,73 @@ class BigQueryUploader(Uploader):
             else:
                 tty.die("Encountered errors while inserting rows: {}".format(errors))
 
+    def _upload_rows(self, client, table_id, rows, row_ids):
+        """Upload rows to table_id, returning a list of errors
+
+        Large uploads use a single load job, smaller ones use streaming
+        inserts which are deduplicated by their row_ids.
+        """
+        if len(rows) > load_job_threshold:
+            return self._load_rows(client, table_id, rows)
+        return self._insert_rows(client, table_id, rows, row_ids)
+
+    def _load_rows(self, client, table_id, rows):
+        """Append rows to table_id with a newline delimited JSON load job"""
+        from google.cloud import bigquery
+
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND)
+        data = io.BytesIO('\n'.join(_dumps(row) for row in rows).encode())
+
+        job = None
+        try:
+            job = client.load_table_from_file(data, table_id, job_config=job_config)
+            job.result()  # Waits for the job to complete.
+        except GoogleAPIError as e:
+            return (job and job.errors) or [str(e)]
+        return []
+
+    def _insert_rows(self, client, table_id, rows, row_ids):
+        """Insert rows into table_id in batches of insert_batch_size rows
+
+        Batches are uploaded by up to _upload_concurrency() threads at a
+        time. The upload stops at the first failed batch, and its errors are
+        returned. Batches already sent are not rolled back, so a failed
+        upload may leave some rows in the table; retrying it is safe because
+        the rows are deduplicated by their row_ids.
+        """
+        batches = list(zip(_chunks(rows, insert_batch_size),
+                           _chunks(row_ids, insert_batch_size)))
+        workers = min(_upload_concurrency(), len(batches))
+
+        if workers <= 1:
+            for batch, batch_ids in batches:
+                errors = self._insert_batch(client, table_id, batch, batch_ids)
+                if errors:
+                    return errors
+            return []
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._insert_batch, client, table_id,
+                                       batch, batch_ids)
+                       for batch, batch_ids in batches]
+            for future in as_completed(futures):
+                errors = future.result()
+                if errors:
+                    # Batches that have not started yet are not sent
+                    for pending in futures:
+                        pending.cancel()
+                    return errors
+        return []
+
+    def _insert_batch(self, client, table_id, batch, batch_ids):
+        """Stream a single batch of rows into table_id, returning its errors"""
+        try:
+            return client.insert_rows_json(table_id, batch, row_ids=batch_ids)
+        except GoogleAPIError as e:
+            return [str(e)]
+
     def perform_upload(self, uri, workspace_name, results):
         super().perform_upload(uri, workspace_name, results)
 
@@ -179,20 +316,3 @@ class BigQueryUploader(Uploader):
         # json_str = sjson.dump(results)
 
         self.insert_data(uri, workspace_name, results)
-
-    # def get_max_current_id(uri, table):
-        # TODO: Generating an id based on the max in use id is dangerous, and
-        # technically gives a race condition in parallel, and should be done in
-        # a more graceful and scalable way..  like hashing the experiment? or
-        # generating a known unique id for it
-        # query = "SELECT MAX(id) FROM `{uri}.{table}` LIMIT 1".format(uri=uri, table=table)
-        # query_job = client.query(query)
-        # results = query_job.result()  # Waits for job to complete.
-        # return results[0]
-
-    def get_expierment_id(experiment):
-        # get_max_current_id(...) # Warning: dangerous..
-
-        # This should be stable per machine/python version, but is not
-        # guarnteed to be globally stable
-        return hash(json.dumps(experiment, sort_keys=True))
@@ -6,6 +6,8 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
+import re
+
 import llnl.util.tty as tty
 
 import ramble.language.language_base
@@ -21,6 +23,22 @@ class ApplicationMeta(ramble.language.language_base.DirectiveMeta):
 application_directive = ApplicationMeta.directive
 
 
+#: Type of compiled regular expressions (re.Pattern is not in Python 3.6)
+_compiled_regex_type = type(re.compile(''))
+
+
+def _split_regex(regex):
+    """Pattern string and compiled pattern of a regex given as either one
+
+    Definitions store the pattern string, so they can be compared and
+    serialized, and keep a given compiled pattern next to it, with its
+    flags, to match with. The compiled pattern is None for strings.
+    """
+    if isinstance(regex, _compiled_regex_type):
+        return regex.pattern, regex
+    return regex, None
+
+
 @application_directive('workloads')
 def workload(name, executables=None, executable=None, input=None,
              inputs=None, **kwargs):
@@ -31,40 +49,38 @@ def workload(name, executables=None, executable=None, input=None,
 
     Input arguments:
         - executable: The name of an executable to be used
-        - executables: A list of executable names to be used
+        - executables: A list (or tuple) of executable names to be used
         - input (Optional): The name of an input be used
-        - inputs (Optional): A list of input names that will be used
+        - inputs (Optional): A list (or tuple) of input names that will be used
 
     Either executable, or executables is a required input argument.
     """
 
+    if not (executables or executable):
+        raise DirectiveError('workload directive requires one of:\n' +
+                             '  executable\n' +
+                             '  executables\n')
+
     def _execute_workload(app):
         app.workloads[name] = {
             'executables': [],
             'inputs': []
         }
 
-        found_exec = False
+        # Workloads always get their own lists, as required builtins are
+        # injected into them, so definitions can share a tuple of names.
         if executables:
-            found_exec = True
-            if isinstance(executables, list):
+            if isinstance(executables, (list, tuple)):
                 app.workloads[name]['executables'].extend(
                     executables)
             else:
-                app.workloads[name]['executables'].append(
-                    executables.copy())
+                app.workloads[name]['executables'].append(executables)
 
         if executable:
-            found_exec = True
             app.workloads[name]['executables'].append(executable)
 
-        if not found_exec:
-            raise DirectiveError('workload directive requires one of:\n' +
-                                 '  executable\n' +
-                                 '  executables\n')
-
         if inputs:
-            if isinstance(inputs, list):
+            if isinstance(inputs, (list, tuple)):
                 app.workloads[name]['inputs'].extend(inputs)
             else:
                 app.workloads[name]['inputs'].append(inputs)
@@ -118,14 +134,18 @@ def figure_of_merit_context(name, regex, output_format):
      - name: High level name of the context. Can be referred to in
              the figure of merit
      - regex: Regular expression, using group names, to match a context.
+              Can be a string or a compiled pattern.
      - output_format: String, using python keywords {group_name} to
                       extract group names from context regular
                       expression.
     """
 
+    regex, compiled_regex = _split_regex(regex)
+
     def _execute_figure_of_merit_context(app):
         app.figure_of_merit_contexts[name] = {
             'regex': regex,
+            'compiled_regex': compiled_regex,
             'output_format': output_format
         }
 
@@ -159,17 +179,21 @@ def figure_of_merit(name, log_file, fom_regex, group_name, units='',
     Inputs:
      - name: High level name of the figure of merit
      - log_file: File the figure of merit can be extracted from
-     - fom_regex: A regular expression using named groups to extract the FOM
+     - fom_regex: A regular expression using named groups to extract the FOM.
+                  Can be a string or a compiled pattern.
      - group_name: The name of the group that the FOM should be pulled from
      - units: The units associated with the FOM
      - keep_policy: The policy for determining which FOM(s) to keep
                     can be 'last' or 'all'
     """
 
+    fom_regex, compiled_regex = _split_regex(fom_regex)
+
     def _execute_figure_of_merit(app):
         app.figures_of_merit[name] = {
             'log_file': log_file,
             'regex': fom_regex,
+            'compiled_regex': compiled_regex,
             'group_name': group_name,
             'units': units,
             'contexts': contexts
@@ -223,11 +247,11 @@ def workload_variable(name, default, description, values=None, workload=None,
     These are specific to each workload.
     """
 
-    def _execute_workload_variable(app):
-        if not (workload or workloads):
-            raise DirectiveError('workload_variable directive requires:\n' +
-                                 '  workload or workloads to be defined.')
+    if not (workload or workloads):
+        raise DirectiveError('workload_variable directive requires:\n' +
+                             '  workload or workloads to be defined.')
 
+    def _execute_workload_variable(app):
         all_workloads = []
         if workload:
             all_workloads.append(workload)
@@ -260,7 +284,7 @@ def default_compiler(name, spack_spec, compiler_spec=None, compiler=None):
     """
 
     def _execute_default_compiler(app):
-        if app.uses_spack:
+        if getattr(app, 'uses_spack', False):
             app.default_compilers[name] = {
                 'spack_spec': spack_spec,
                 'compiler_spec': compiler_spec,
@@ -285,7 +309,7 @@ def software_spec(name, spack_spec, compiler_spec=None, compiler=None):
     """
 
     def _execute_software_spec(app):
-        if app.uses_spack:
+        if getattr(app, 'uses_spack', False):
 
             # Define the spec
             app.software_specs[name] = {
@@ -322,17 +346,21 @@ def success_criteria(name, mode, match, file):
       - mode: The type of success criteria that will be validated
               Valid values are: 'string'
       - match: The value to check indicate success (if found, it would mark success)
+               Can be a string or a compiled pattern.
       - file: Which file the success criteria should be located in
     """
 
-    def _execute_success_criteria(app):
-        valid_modes = ['string']
-        if mode not in valid_modes:
-            tty.die(f'Mode {mode} is not valid. Valid values are {valid_modes}')
+    valid_modes = ['string']
+    if mode not in valid_modes:
+        tty.die(f'Mode {mode} is not valid. Valid values are {valid_modes}')
 
+    match, compiled_match = _split_regex(match)
+
+    def _execute_success_criteria(app):
         app.success_criteria[name] = {
             'mode': mode,
             'match': match,
+            'compiled_match': compiled_match,
             'file': file
         }
 
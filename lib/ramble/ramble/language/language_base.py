@@ -173,8 +173,10 @@ class DirectiveMeta(type):
                         # Descend into args that are lists or tuples
                         for a in arg:
                             remove_directives(a)
-                    else:
-                        # Remove directives args from the exec queue
+                    elif callable(arg):
+                        # Remove directives args from the exec queue. Only
+                        # directive results are callable, so plain values
+                        # never need to be searched for.
                         remove = next(
                             (d for d in directives if d is arg), None)
                         if remove is not None:
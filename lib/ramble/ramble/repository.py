@@ -157,12 +157,13 @@ def use_repositories(*paths_and_repos):
     saved = apps_path
     remove_from_meta = set_path(temporary_repositories)
 
-    yield temporary_repositories
-
-    # Restore _path and sys.meta_path
-    if remove_from_meta:
-        sys.meta_path.remove(temporary_repositories)
-    apps_path = saved
+    try:
+        yield temporary_repositories
+    finally:
+        # Restore _path and sys.meta_path
+        if remove_from_meta:
+            sys.meta_path.remove(temporary_repositories)
+        apps_path = saved
 
 
 #####################################
@@ -338,9 +339,8 @@ class TagIndex(Mapping):
             if obj_name in obj_list:
                 obj_list.remove(obj_name)
 
-        # Add it again under the appropriate tags
-        for tag in getattr(obj, 'tags', []):
-            tag = tag.lower()
+        # Add it again under the appropriate tags, once per distinct tag
+        for tag in set(tag.lower() for tag in getattr(obj, 'tags', [])):
             self._tag_dict[tag].append(obj.name)
 
 
@@ -1037,7 +1037,7 @@ class Repo(object):
         return names
 
     def objects_with_tags(self, *tags):
-        v = set(self.all_object_names())
+        v = set(self._obj_checker.keys())
         index = self.tag_index
 
         for t in tags:
@@ -1132,6 +1132,10 @@ class Repo(object):
             raise InvalidNamespaceError('Invalid namespace for %s repo: %s'
                                         % (self.namespace, namespace))
 
+        # Classes are built once per module, which is cached in this repo
+        if obj_name in self._classes:
+            return self._classes[obj_name]
+
         class_name = nm.mod_to_class(obj_name)
         tty.debug(' Class name = %s' % class_name)
         module = self._get_obj_module(obj_name)
@@ -1140,6 +1144,7 @@ class Repo(object):
         if not inspect.isclass(cls):
             tty.die("%s.%s is not a class" % (obj_name, class_name))
 
+        self._classes[obj_name] = cls
         return cls
 
     def __str__(self):
@@ -7,6 +7,8 @@
 # except according to those terms.
 """Perform tests of the Application class"""
 
+import re
+
 import pytest
 
 from ramble.appkit import *  # noqa
@@ -242,6 +244,24 @@ def test_workload_directive(app_class):
         assert test in app_inst.workloads[wl_name]['inputs']
 
 
+@pytest.mark.parametrize('app_class', app_types)
+def test_workload_directive_shared_tuple(app_class):
+    app_inst = app_class('/not/a/path')
+    shared_execs = ('SharedExec1', 'SharedExec2')
+
+    workload('TupleWorkload1', executables=shared_execs)(app_inst)  # noqa: F405
+    workload('TupleWorkload2', executables=shared_execs)(app_inst)  # noqa: F405
+
+    wl_execs1 = app_inst.workloads['TupleWorkload1']['executables']
+    wl_execs2 = app_inst.workloads['TupleWorkload2']['executables']
+    assert wl_execs1 == list(shared_execs)
+    assert wl_execs2 == list(shared_execs)
+
+    # Each workload needs its own list, as builtins are injected into them
+    wl_execs1.insert(0, 'builtin::env_vars')
+    assert wl_execs2 == list(shared_execs)
+
+
 @pytest.mark.parametrize('app_class', app_types)
 def test_executable_directive(app_class):
     app_inst = app_class('/not/a/path')
@@ -273,6 +293,29 @@ def test_figure_of_merit_directive(app_class):
                 == conf_val
 
 
+@pytest.mark.parametrize('app_class', app_types)
+def test_compiled_regexes_are_stored_as_patterns(app_class):
+    app_inst = app_class('/not/a/path')
+    fom_regex = r'.*(?P<fom_val>[0-9]+).*'
+    context_regex = r'Context (?P<ctx>[0-9]+)'
+
+    figure_of_merit('CompiledFom', '{log_file}', re.compile(fom_regex),  # noqa: F405
+                    'fom_val', '(s)')(app_inst)
+    figure_of_merit_context('compiled_context',  # noqa: F405
+                            re.compile(context_regex), '{ctx}')(app_inst)
+
+    assert app_inst.figures_of_merit['CompiledFom']['regex'] == fom_regex
+    assert app_inst.figure_of_merit_contexts['compiled_context']['regex'] == context_regex
+
+    # The compiled pattern is kept to match with, including its flags
+    compiled_regex = re.compile(fom_regex, re.IGNORECASE)
+    figure_of_merit('FlagsFom', '{log_file}', compiled_regex,  # noqa: F405
+                    'fom_val')(app_inst)
+    assert app_inst.figures_of_merit['FlagsFom']['regex'] == fom_regex
+    assert app_inst.figures_of_merit['FlagsFom']['compiled_regex'] is compiled_regex
+    assert app_inst.figures_of_merit['CompiledFom']['compiled_regex'].pattern == fom_regex
+
+
 @pytest.mark.parametrize('app_class', app_types)
 def test_input_file_directive(app_class):
     app_inst = app_class('/not/a/path')
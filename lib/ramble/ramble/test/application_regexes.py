@@ -0,0 +1,72 @@
+# Copyright 2022-2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+"""Perform tests of the regular expressions in builtin applications"""
+
+import re
+
+import pytest
+
+import ramble.repository
+
+
+def app_class(app_name):
+    return ramble.repository.apps_path.get_obj_class(app_name)
+
+
+def fom_regex(app_name, fom_name):
+    return re.compile(app_class(app_name).figures_of_merit[fom_name]['regex'])
+
+
+@pytest.mark.parametrize('app_name', ['cloverleaf', 'minixyce'])
+@pytest.mark.parametrize('value', [
+    '1', '-1', '+1.5', '1.', '.5', '0.1000E+03', '1.0e-3', '1E5',
+    # Fortran E-format with a 3-digit exponent omits the 'E'
+    '0.1234-100', '1.0+100'
+])
+def test_floating_point_regex_matches(app_name, value):
+    assert re.fullmatch(app_class(app_name).floating_point_regex, value)
+
+
+@pytest.mark.parametrize('app_name', ['cloverleaf', 'minixyce'])
+@pytest.mark.parametrize('value', ['', '.', 'E5', '1.0E', '1.0+', '1..0'])
+def test_floating_point_regex_rejects(app_name, value):
+    assert not re.fullmatch(app_class(app_name).floating_point_regex, value)
+
+
+def test_cloverleaf_step_summary_regex():
+    regex = fom_regex('cloverleaf', 'Final Kinetic Energy')
+
+    line = ' step:    2955  0.1000E+03  0.1234E+02  0.1234-100  0.2500E+01' + \
+        '  0.5000E+01  1.0+100  0.1000E+03'
+    match = regex.match(line)
+    assert match
+    assert match.group('step') == '2955'
+    assert match.group('density') == '0.1234-100'
+    assert match.group('kinetic_energy') == '1.0+100'
+    assert match.group('total_energy') == '0.1000E+03'
+
+    # A near miss must be rejected without catastrophic backtracking
+    near_miss = ' step: 1 ' + ' '.join(['1' * 30] * 6) + ' x'
+    assert not regex.match(near_miss)
+
+
+def test_minixyce_state_variable_regex():
+    regex = fom_regex('minixyce', 'Value')
+
+    match = regex.match('12: V001 = 0.1234-100')
+    assert match
+    assert match.group('State_Variable') == '12'
+    assert match.group('name') == 'V001'
+    assert match.group('value') == '0.1234-100'
+
+    match = regex.match('V001 = 1.5')
+    assert match
+    assert match.group('State_Variable') is None
+
+    # A near miss must be rejected without catastrophic backtracking
+    assert not regex.match('1' * 40 + ' x')
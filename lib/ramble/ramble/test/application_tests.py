@@ -9,13 +9,20 @@
 
 import pytest
 
-
-@pytest.mark.parametrize('app', [
+feature_apps = [
     'basic', 'basic-inherited', 'input-test', 'interleved-env-vars',
     'register-builtin'
-])
-def test_app_features(mutable_mock_repo, app):
-    app_inst = mutable_mock_repo.get(app)
+]
+
+
+@pytest.fixture
+def app_inst(request, mock_app_instances):
+    """Shared mock application instance named by the indirect parameter"""
+    return mock_app_instances(request.param)
+
+
+@pytest.mark.parametrize('app_inst', feature_apps, indirect=True)
+def test_app_features(app_inst):
     assert hasattr(app_inst, 'workloads')
     assert hasattr(app_inst, 'executables')
     assert hasattr(app_inst, 'figures_of_merit')
@@ -27,8 +34,8 @@ def test_app_features(mutable_mock_repo, app):
     assert hasattr(app_inst, 'builtins')
 
 
-def test_basic_app(mutable_mock_repo):
-    basic_inst = mutable_mock_repo.get('basic')
+def test_basic_app(mock_app_instances):
+    basic_inst = mock_app_instances('basic')
     assert 'foo' in basic_inst.executables
     assert basic_inst.executables['foo']['template'] == 'bar'
     assert not basic_inst.executables['foo']['mpi']
@@ -80,8 +87,9 @@ def test_env_var_set_command_gen(mutable_mock_repo):
     ]
 
     out_cmds, _ = basic_inst._get_env_set_commands(tests, set())
+    out_set = set(out_cmds)
     for cmd in answer:
-        assert cmd in out_cmds
+        assert cmd in out_set
 
 
 def test_env_var_append_command_gen(mutable_mock_repo):
@@ -116,8 +124,9 @@ def test_env_var_append_command_gen(mutable_mock_repo):
     ]
 
     out_cmds, _ = basic_inst._get_env_append_commands(tests, set())
+    out_set = set(out_cmds)
     for cmd in answer:
-        assert cmd in out_cmds
+        assert cmd in out_set
 
 
 def test_env_var_prepend_command_gen(mutable_mock_repo):
@@ -144,8 +153,9 @@ def test_env_var_prepend_command_gen(mutable_mock_repo):
     ]
 
     out_cmds, _ = basic_inst._get_env_prepend_commands(tests, set())
+    out_set = set(out_cmds)
     for cmd in answer:
-        assert cmd in out_cmds
+        assert cmd in out_set
 
 
 def test_env_var_unset_command_gen(mutable_mock_repo):
@@ -162,13 +172,17 @@ def test_env_var_unset_command_gen(mutable_mock_repo):
     ]
 
     out_cmds, _ = basic_inst._get_env_unset_commands(tests, set())
+    out_set = set(out_cmds)
     for cmd in answer:
-        assert cmd in out_cmds
+        assert cmd in out_set
 
 
 @pytest.mark.parametrize('app_name', ['basic', 'zlib'])
-def test_application_copy_is_deep(mutable_mock_repo, app_name):
-    src_inst = mutable_mock_repo.get(app_name)
+def test_application_copy_is_deep(mock_app_instances, app_name):
+    # This test modifies its instance, so make a new one of the shared
+    # instance's class and set it up below
+    shared_inst = mock_app_instances(app_name)
+    src_inst = type(shared_inst)(shared_inst._file_path)
 
     defined_variables = {
         'test_var1': 'test_val1',
@@ -246,9 +260,11 @@ def test_application_copy_is_deep(mutable_mock_repo, app_name):
                            set_group['var-separator']
                 if 'vars' in set_group:
                     assert 'vars' in copy_inst._env_variable_sets[var_set][idx]
+                    copy_vars = copy_inst._env_variable_sets[var_set][idx]['vars']
+                    copy_keys = set(copy_vars)
                     for var, val in set_group['vars'].items():
-                        assert var in copy_inst._env_variable_sets[var_set][idx]['vars']
-                        assert copy_inst._env_variable_sets[var_set][idx]['vars'][var] == val
+                        assert var in copy_keys
+                        assert copy_vars[var] == val
         elif var_set == 'unset':
             for var in src_inst._env_variable_sets[var_set]:
                 assert var in copy_inst._env_variable_sets[var_set]
@@ -263,39 +279,37 @@ def test_application_copy_is_deep(mutable_mock_repo, app_name):
                     assert option in copy_inst.internals[internal][exec_name]
                     assert copy_inst.internals[internal][exec_name][option] == value
 
+    # Test nested data is not shared
+    copy_inst._env_variable_sets['append'][0]['vars']['APPEND_VAR'] = 'CHANGED'
+    copy_inst.internals['custom_executables']['test_exec']['templates'].append('changed')
+    assert src_inst._env_variable_sets['append'][0]['vars']['APPEND_VAR'] == 'APPEND_TEST'
+    assert src_inst.internals['custom_executables']['test_exec']['templates'] == \
+        ['test_exec']
 
-@pytest.mark.parametrize('app', [
-    'basic', 'basic-inherited', 'input-test', 'interleved-env-vars',
-    'register-builtin'
-])
-def test_required_builtins(mutable_mock_repo, app):
-    app_inst = mutable_mock_repo.get(app)
 
-    required_builtins = []
+@pytest.mark.parametrize('app_inst', feature_apps, indirect=True)
+def test_required_builtins(app_inst):
     for builtin, conf in app_inst.builtins.items():
-        if conf[app_inst._builtin_required_key]:
-            required_builtins.append(builtin)
+        assert (builtin in app_inst.required_builtins) == \
+            bool(conf[app_inst._builtin_required_key])
 
     for workload, wl_conf in app_inst.workloads.items():
         if app_inst._workload_exec_key in wl_conf:
-            for builtin in required_builtins:
-                assert builtin in wl_conf[app_inst._workload_exec_key]
+            wl_execs = set(wl_conf[app_inst._workload_exec_key])
+            for builtin in app_inst.required_builtins:
+                assert builtin in wl_execs
 
 
-def test_register_builtin_app(mutable_mock_repo):
-    app_inst = mutable_mock_repo.get('register-builtin')
+def test_register_builtin_app(mock_app_instances):
+    app_inst = mock_app_instances('register-builtin')
 
-    required_builtins = []
-    excluded_builtins = []
-    for builtin, conf in app_inst.builtins.items():
-        if conf[app_inst._builtin_required_key]:
-            required_builtins.append(builtin)
-        else:
-            excluded_builtins.append(builtin)
+    required_builtins = app_inst.required_builtins
+    excluded_builtins = set(app_inst.builtins.keys()) - set(required_builtins)
 
     for workload, wl_conf in app_inst.workloads.items():
         if app_inst._workload_exec_key in wl_conf:
+            wl_execs = set(wl_conf[app_inst._workload_exec_key])
             for builtin in required_builtins:
-                assert builtin in wl_conf[app_inst._workload_exec_key]
+                assert builtin in wl_execs
             for builtin in excluded_builtins:
-                assert builtin not in wl_conf[app_inst._workload_exec_key]
+                assert builtin not in wl_execs
@@ -419,6 +419,12 @@ def test_remove_workspace():
     assert 'bar' not in out
 
 
+def test_remove_workspace_invalid_name():
+    workspace('remove', '-y', 'bad/name', fail_on_error=False)
+    assert isinstance(workspace.error, ValueError)
+    assert 'names must start with a letter' in str(workspace.error)
+
+
 def test_concretize_command():
     ws_name = 'test'
     workspace('create', ws_name)
@@ -16,10 +16,12 @@ import pytest
 
 from llnl.util.filesystem import remove_linked_tree
 
+import ramble.caches
 import ramble.config
 import ramble.paths
 import ramble.repository
 import ramble.stage
+import ramble.util.file_cache
 from ramble.fetch_strategy import FetchError, FetchStrategyComposite, URLFetchStrategy
 
 import spack.platforms
@@ -79,6 +81,17 @@ def no_chdir():
         assert os.getcwd() == original_wd
 
 
+@pytest.fixture(scope='session', autouse=True)
+def mock_misc_cache(tmpdir_factory):
+    """Keep the misc cache, and anything tests write to it, out of the
+    user's ~/.ramble directory."""
+    saved_cache = ramble.caches.misc_cache
+    ramble.caches.misc_cache = ramble.util.file_cache.FileCache(
+        str(tmpdir_factory.mktemp('misc_cache')))
+    yield ramble.caches.misc_cache
+    ramble.caches.misc_cache = saved_cache
+
+
 def remove_whatever_it_is(path):
     """Type-agnostic remove."""
     if os.path.isfile(path):
@@ -148,6 +161,25 @@ def mutable_mock_repo(mock_repo_path):
         yield mock_repo_path
 
 
+@pytest.fixture(scope='session')
+def mock_app_instances(mock_repo_path):
+    """Session-scoped cache of mock application instances.
+
+    Returns a function mapping an application name to its instance, which is
+    only created the first time the name is requested. Instances are shared
+    between tests, so tests must not modify them.
+    """
+    instances = {}
+
+    def _get(name):
+        if name not in instances:
+            with ramble.repository.use_repositories(mock_repo_path):
+                instances[name] = mock_repo_path.get(name)
+        return instances[name]
+
+    return _get
+
+
 @pytest.fixture(scope='session')
 def default_config():
     """Isolates the default configuration from the user configs.
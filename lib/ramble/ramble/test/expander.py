@@ -46,6 +46,18 @@ def test_expansions():
     assert expander.expand_var('((((16-10+2)/4)**2)*4)') == '16.0'
 
 
+def test_batched_expansions():
+    expansion_vars = exp_dict()
+
+    expander = ramble.expander.Expander(expansion_vars, None)
+
+    expanded = expander.expand_vars(['var1', 'application_name', 'n_nodes'])
+    assert expanded == {'var1': '3', 'application_name': 'foo', 'n_nodes': '2'}
+
+    expanded = expander.expand_vars(['var1', 'var4'], extra_vars={'var4': '{var2}*2'})
+    assert expanded == {'var1': '3', 'var4': '6'}
+
+
 def test_expansion_namespaces():
     expansion_vars = exp_dict()
 
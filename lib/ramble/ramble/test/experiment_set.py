@@ -100,6 +100,39 @@ def test_vector_experiment_in_set(mutable_mock_workspace_path):
         assert 'basic.test_wl.series1_8' in exp_set.experiments.keys()
 
 
+def test_search_primary_experiments(mutable_mock_workspace_path):
+    workspace('create', 'test')
+
+    with ramble.workspace.read('test') as ws:
+        exp_set = ramble.experiment_set.ExperimentSet(ws)
+
+        app_vars = {
+            'n_ranks': '{processes_per_node}*{n_nodes}',
+            'mpi_command': '',
+            'batch_submit': ''
+        }
+        wl_vars = {
+            'processes_per_node': '2'
+        }
+        exp_vars = {
+            'n_nodes': ['2', '4']
+        }
+
+        exp_set.set_application_context('basic', app_vars, None, None, None, None)
+        exp_set.set_workload_context('test_wl', wl_vars, None, None, None, None)
+        exp_set.set_experiment_context('series1_{n_ranks}', exp_vars,
+                                       None, None, None, None, None)
+        exp_set.build_experiment_chains()
+
+        assert exp_set.search_primary_experiments('basic.test_wl.series1_4') == \
+            ['basic.test_wl.series1_4']
+        assert exp_set.search_primary_experiments('basic.test_wl.series1_2') == []
+        assert exp_set.search_primary_experiments('basic.test_wl.*') == \
+            ['basic.test_wl.series1_4', 'basic.test_wl.series1_8']
+        assert exp_set.search_primary_experiments('basic.test_wl.series1_[8]') == \
+            ['basic.test_wl.series1_8']
+
+
 def test_nonunique_vector_errors(mutable_mock_workspace_path, capsys):
     workspace('create', 'test')
 
@@ -0,0 +1,201 @@
+# Copyright 2022-2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+"""Tests of the BigQuery uploader, using a client that records its calls"""
+
+import json
+import threading
+
+import pytest
+
+import ramble.experimental.uploader as uploader
+
+
+class FakeClient(object):
+    """Stands in for a bigquery.Client, recording every request it gets"""
+
+    def __init__(self, fail_table=None, fail_batch=None):
+        self.inserts = []
+        self.loads = []
+        self.fail_table = fail_table
+        self.fail_batch = fail_batch
+        self._lock = threading.Lock()
+
+    def insert_rows_json(self, table_id, rows, row_ids=None):
+        with self._lock:
+            self.inserts.append({
+                'table': table_id,
+                'rows': list(rows),
+                'row_ids': list(row_ids),
+                'thread': threading.get_ident(),
+            })
+        if table_id == self.fail_table:
+            return [{'index': 0, 'errors': ['failed']}]
+        if self.fail_batch is not None and rows[0]['n'] == self.fail_batch:
+            return [{'index': 0, 'errors': ['failed']}]
+        return []
+
+    def load_table_from_file(self, data, table_id, job_config=None):
+        self.loads.append({'table': table_id, 'data': data.read().decode()})
+        return FakeJob()
+
+    def tables(self, name):
+        return [call for call in self.inserts if call['table'].endswith(name)]
+
+
+class FakeJob(object):
+    errors = None
+
+    def result(self):
+        pass
+
+
+def make_uploader(client):
+    bq_uploader = uploader.BigQueryUploader()
+    bq_uploader._client = client
+    return bq_uploader
+
+
+def make_rows(num_rows):
+    rows = [{'n': i} for i in range(num_rows)]
+    return rows, [str(i) for i in range(num_rows)]
+
+
+def make_results(experiment_names):
+    experiments = []
+    for name in experiment_names:
+        experiments.append({
+            'name': name,
+            'RAMBLE_STATUS': 'SUCCESS',
+            'RAMBLE_VARIABLES': {
+                'application_name': 'app',
+                'workspace_name': 'ws',
+                'workload_name': 'workload',
+                'n_nodes': 1,
+                'processes_per_node': 2,
+                'n_ranks': 2,
+                'n_threads': 1,
+            },
+            'CONTEXTS': [
+                {'name': context,
+                 'foms': [{'name': 'time', 'value': 1.0, 'units': 's'},
+                          {'name': 'rate', 'value': 2.0, 'units': 'Hz'}]}
+                for context in ['null', 'step 1']
+            ],
+        })
+    return uploader.format_data({'experiments': experiments})
+
+
+@pytest.mark.parametrize('num_rows,batch_sizes', [
+    (1, [1]),
+    (500, [500]),
+    (501, [500, 1]),
+    (1000, [500, 500]),
+])
+def test_insert_rows_in_batches(monkeypatch, num_rows, batch_sizes):
+    monkeypatch.setenv(uploader.concurrency_env_var, '1')
+    client = FakeClient()
+    rows, row_ids = make_rows(num_rows)
+
+    errors = make_uploader(client)._insert_rows(client, 'table', rows, row_ids)
+
+    assert errors == []
+    assert [len(call['rows']) for call in client.inserts] == batch_sizes
+    assert [row for call in client.inserts for row in call['rows']] == rows
+    assert [i for call in client.inserts for i in call['row_ids']] == row_ids
+
+
+def test_large_uploads_use_load_jobs(monkeypatch):
+    client = FakeClient()
+    bq_uploader = make_uploader(client)
+    loaded = []
+    monkeypatch.setattr(bq_uploader, '_load_rows',
+                        lambda client, table_id, rows: loaded.append(rows) or [])
+
+    rows, row_ids = make_rows(uploader.load_job_threshold)
+    assert bq_uploader._upload_rows(client, 'table', rows, row_ids) == []
+    assert not loaded
+    assert len(client.inserts) == 2
+
+    client.inserts = []
+    rows, row_ids = make_rows(uploader.load_job_threshold + 1)
+    assert bq_uploader._upload_rows(client, 'table', rows, row_ids) == []
+    assert loaded == [rows]
+    assert not client.inserts
+
+
+def test_load_job_writes_ndjson():
+    pytest.importorskip('google.cloud.bigquery')
+    client = FakeClient()
+    rows, _ = make_rows(3)
+
+    assert make_uploader(client)._load_rows(client, 'table', rows) == []
+    assert len(client.loads) == 1
+    lines = client.loads[0]['data'].split('\n')
+    assert [json.loads(line) for line in lines] == rows
+
+
+def test_row_ids_are_stable_and_unique():
+    results = make_results(['exp_1', 'exp_2'])
+
+    def upload_row_ids():
+        client = FakeClient()
+        make_uploader(client).insert_data('project.dataset', 'ws', results)
+        return ([i for call in client.tables('.experiments') for i in call['row_ids']],
+                [i for call in client.tables('.foms') for i in call['row_ids']])
+
+    exp_ids, fom_ids = upload_row_ids()
+    # 2 experiments, with 2 contexts of 2 foms each
+    assert len(set(exp_ids)) == 2
+    assert len(set(fom_ids)) == 8
+
+    # Retrying the same upload reuses the same ids, so BigQuery can drop
+    # the duplicate rows
+    assert upload_row_ids() == (exp_ids, fom_ids)
+
+
+def test_experiment_errors_skip_fom_upload():
+    client = FakeClient(fail_table='project.dataset.experiments')
+    results = make_results(['exp_1'])
+
+    with pytest.raises(SystemExit):
+        make_uploader(client).insert_data('project.dataset', 'ws', results)
+
+    assert client.tables('.experiments')
+    assert not client.tables('.foms')
+
+
+@pytest.mark.parametrize('concurrency', ['1', '4'])
+def test_insert_concurrency(monkeypatch, concurrency):
+    monkeypatch.setenv(uploader.concurrency_env_var, concurrency)
+    client = FakeClient()
+    rows, row_ids = make_rows(2000)
+
+    errors = make_uploader(client)._insert_rows(client, 'table', rows, row_ids)
+
+    assert errors == []
+    uploaded = sorted((row for call in client.inserts for row in call['rows']),
+                      key=lambda row: row['n'])
+    assert uploaded == rows
+
+    # A single worker uploads from the calling thread
+    in_main_thread = [call['thread'] == threading.get_ident()
+                      for call in client.inserts]
+    assert all(in_main_thread) if concurrency == '1' else not any(in_main_thread)
+
+
+@pytest.mark.parametrize('concurrency', ['1', '4'])
+def test_insert_stops_at_failed_batch(monkeypatch, concurrency):
+    monkeypatch.setenv(uploader.concurrency_env_var, concurrency)
+    client = FakeClient(fail_batch=0)
+    rows, row_ids = make_rows(2000)
+
+    errors = make_uploader(client)._insert_rows(client, 'table', rows, row_ids)
+
+    assert errors == [{'index': 0, 'errors': ['failed']}]
+    if concurrency == '1':
+        assert len(client.inserts) == 1
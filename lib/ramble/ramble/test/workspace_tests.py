@@ -11,6 +11,7 @@ import os
 import pytest
 
 import ramble.workspace
+import ramble.workspace.workspace
 
 # everything here uses the mock_workspace_path
 pytestmark = pytest.mark.usefixtures(
@@ -29,3 +30,72 @@ def test_re_read(tmpdir):
         test_workspace = ramble.workspace.Workspace(os.getcwd(), True)
         test_workspace.clear()
         test_workspace._re_read()
+
+
+def test_config_parse_is_cached(tmpdir, monkeypatch):
+    ws_module = ramble.workspace.workspace
+    cache_dir = tmpdir.join('config-cache')
+    monkeypatch.setattr(ws_module, '_config_cache_dir', lambda: str(cache_dir))
+
+    # Count parses of workspace configs, to detect cache hits
+    config_parses = []
+    read_yaml = ws_module._read_yaml
+
+    def _counting_read_yaml(str_or_file, schema):
+        if schema is ws_module.config_schema:
+            config_parses.append(str_or_file)
+        return read_yaml(str_or_file, schema)
+
+    monkeypatch.setattr(ws_module, '_read_yaml', _counting_read_yaml)
+
+    ws_dir = tmpdir.mkdir('workspace')
+    with ws_dir.as_cwd():
+        test_workspace = ramble.workspace.Workspace(os.getcwd())
+        test_workspace.write()
+
+        # The first read parses the config and caches it outside the workspace
+        test_workspace = ramble.workspace.Workspace(os.getcwd())
+        cache_path = ws_module._config_cache_path(test_workspace.config_file_path)
+        assert os.path.exists(cache_path)
+        assert cache_path.startswith(str(cache_dir))
+        first_yaml = test_workspace.config_sections['workspace']['yaml']
+
+        # An unchanged config is read back from the cache without parsing
+        num_parses = len(config_parses)
+        test_workspace = ramble.workspace.Workspace(os.getcwd())
+        assert len(config_parses) == num_parses
+        assert test_workspace.config_sections['workspace']['yaml'] == first_yaml
+
+        # Editing the config invalidates the cache
+        with open(test_workspace.config_file_path, 'r') as f:
+            config_text = f.read()
+        with open(test_workspace.config_file_path, 'w') as f:
+            f.write(config_text.replace('mpirun -n {n_ranks}', 'srun -n {n_ranks}'))
+
+        test_workspace = ramble.workspace.Workspace(os.getcwd())
+        assert len(config_parses) == num_parses + 1
+        ws_vars = test_workspace._get_workspace_section('variables')
+        assert ws_vars['mpi_command'] == 'srun -n {n_ranks}'
+
+        # A schema change also invalidates the cache
+        monkeypatch.setattr(ws_module, '_schema_hash', lambda schema: 'changed')
+        test_workspace = ramble.workspace.Workspace(os.getcwd())
+        assert len(config_parses) == num_parses + 2
+
+        # Destroying the workspace drops its cached parse
+        test_workspace.destroy()
+        assert not os.path.exists(cache_path)
+
+
+def test_config_cache_is_bounded(tmpdir, monkeypatch):
+    ws_module = ramble.workspace.workspace
+    monkeypatch.setattr(ws_module, 'config_cache_max_entries', 2)
+
+    cache_dir = tmpdir.mkdir('config-cache')
+    for i in range(4):
+        entry = cache_dir.join(f'{i}.pkl')
+        entry.write('')
+        entry.setmtime(1000 + i)
+
+    ws_module._prune_config_cache(str(cache_dir))
+    assert sorted(os.listdir(str(cache_dir))) == ['2.pkl', '3.pkl']
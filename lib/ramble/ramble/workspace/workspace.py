@@ -9,9 +9,13 @@
 import os
 import contextlib
 import copy
+import hashlib
+import json
+import pickle
 import re
 import shutil
 import stat
+import tempfile
 import datetime
 
 import six
@@ -20,6 +24,7 @@ from llnl.util.lang import union_dicts
 import llnl.util.filesystem as fs
 import llnl.util.tty as tty
 
+import ramble.caches
 import ramble.config
 import ramble.paths
 import ramble.util.path
@@ -35,7 +40,6 @@ import ramble.keywords
 import ramble.software_environments
 from ramble.mirror import MirrorStats
 from ramble.config import ConfigError
-import ramble.experimental.uploader
 
 import spack.util.spack_yaml as syaml
 import spack.util.spack_json as sjson
@@ -77,6 +81,12 @@ workspace_software_path = 'software'
 #: Name of the subdirectory where workspace archives are stored
 workspace_archive_path = 'archive'
 
+#: Subdirectory of ramble's misc cache holding parsed workspace configs
+config_cache_subdir = 'workspace-configs'
+
+#: Most cached config parses to keep, least recently used ones are evicted
+config_cache_max_entries = 256
+
 #: regex for validating workspace names
 valid_workspace_name_re = r'^\w[\w-]*$'
 
@@ -498,8 +508,7 @@ class Workspace(object):
         if read_default:
             self._read_config(config_section, default_config_yaml())
         else:
-            with open(self.config_file_path) as f:
-                self._read_config(config_section, f)
+            self._read_cached_config(config_section)
 
         read_default_script = True
         ext_len = len(workspace_template_extension)
@@ -575,6 +584,65 @@ class Workspace(object):
         self._read_yaml(config, f, raw_yaml)
         self._check_deprecated(config['yaml'])
 
+    def _read_cached_config(self, section):
+        """Read a configuration file, reusing a cached parse of it if the
+        file's contents have not changed since the cache was written.
+
+        Parsing and validating the YAML dominates reading a workspace, so the
+        parsed data is pickled into the user's ramble cache, keyed on the
+        config's absolute path, a hash of its contents, a hash of its schema
+        and the ramble version. The cache never lives in the workspace, as
+        workspaces can be shared with other users and unpickling a file
+        written by someone else would run their code.
+        """
+        config = self.config_sections[section]
+        config_path = os.path.abspath(config['path'])
+        cache_path = _config_cache_path(config_path)
+
+        with open(config_path, 'rb') as f:
+            contents_hash = hashlib.sha256(f.read()).hexdigest()
+        cache_key = (ramble.ramble_version, _schema_hash(config['schema']),
+                     config_path, contents_hash)
+
+        try:
+            # Only trust caches written by the current user
+            if os.stat(cache_path).st_uid == os.getuid():
+                with open(cache_path, 'rb') as f:
+                    cached_key, raw_yaml, yaml = pickle.load(f)
+                if cached_key == cache_key:
+                    config['raw_yaml'], config['yaml'] = raw_yaml, yaml
+                    self._check_deprecated(config['yaml'])
+                    # Mark the entry as recently used, so it is evicted last
+                    with contextlib.suppress(OSError):
+                        os.utime(cache_path)
+                    return
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            tty.debug(f'Ignoring unreadable config cache {cache_path}: {e}')
+
+        with open(config_path) as f:
+            self._read_config(section, f)
+
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            fs.mkdirp(cache_dir, mode=stat.S_IRWXU)
+            # A unique temporary file keeps concurrent writers from
+            # interleaving, and the rename makes the update atomic.
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump((cache_key, config['raw_yaml'], config['yaml']), f,
+                                protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                fs.force_remove(tmp_path)
+                raise
+        except OSError as e:
+            tty.debug(f'Unable to write config cache {cache_path}: {e}')
+        else:
+            _prune_config_cache(cache_dir)
+
     def _check_deprecated(self, config):
         """
         Trap and warn (or error) on deprecated configuration settings
@@ -965,6 +1033,8 @@ class Workspace(object):
         return out_file
 
     def upload_results(self):
+        import ramble.experimental.uploader
+
         if ramble.config.get('config:upload'):
             # Read upload type and push it there
             if ramble.config.get('config:upload:type') == 'BigQuery':  # TODO: enum?
@@ -1452,6 +1522,7 @@ class Workspace(object):
 
     def destroy(self):
         """Remove this workspace from Ramble entirely."""
+        fs.force_remove(_config_cache_path(os.path.abspath(self.config_file_path)))
         shutil.rmtree(self.path)
 
     def _get_workspace_dict(self):
@@ -1583,6 +1654,48 @@ def _equiv_dict(first, second):
     return same_values and same_keys_with_same_overrides
 
 
+def _config_cache_dir():
+    """Directory holding cached parses of workspace configs"""
+    return os.path.join(ramble.caches.misc_cache.root, config_cache_subdir)
+
+
+def _config_cache_path(config_path):
+    """Path to the cached parse of the config file at config_path"""
+    path_hash = hashlib.sha256(config_path.encode('utf-8')).hexdigest()
+    return os.path.join(_config_cache_dir(), f'{path_hash}.pkl')
+
+
+def _prune_config_cache(cache_dir):
+    """Evict the least recently used cached config parses, keeping at most
+    config_cache_max_entries of them."""
+    try:
+        entries = [entry for entry in os.scandir(cache_dir)
+                   if entry.name.endswith('.pkl')]
+        if len(entries) <= config_cache_max_entries:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        fs.force_remove(*[entry.path for entry in entries[config_cache_max_entries:]])
+    except OSError as e:
+        tty.debug(f'Unable to prune config cache {cache_dir}: {e}')
+
+
+#: Memoized schema hashes, keyed by id(schema). The schema itself is kept
+#: alongside its hash so the id cannot be reused by another object.
+_schema_hashes = {}
+
+
+def _schema_hash(schema):
+    """Hash of a config schema, so cached parses follow schema changes"""
+    cached = _schema_hashes.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    schema_str = json.dumps(schema, sort_keys=True, default=str)
+    schema_hash = hashlib.sha256(schema_str.encode('utf-8')).hexdigest()
+    _schema_hashes[id(schema)] = (schema, schema_hash)
+    return schema_hash
+
+
 def _read_yaml(str_or_file, schema):
     """Read YAML from a file for round-trip parsing."""
     data = syaml.load_config(str_or_file)
@@ -58,7 +58,10 @@ class Cloverleaf(SpackApplication):
 
     log_file = '{experiment_run_dir}/clover.out'
 
-    floating_point_regex = r'[\+\-]*[0-9]*\.*[0-9]+E*[\+\-]*[0-9]*'
+    # Each part of a number can only be matched one way, which avoids
+    # catastrophic backtracking on long lines of numbers. Fortran drops the
+    # 'E' from 3-digit exponents (e.g. 0.1234-100), so that form is accepted.
+    floating_point_regex = r'[\+\-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[Ee][\+\-]?[0-9]+|[\+\-][0-9]+)?'
 
     step_count_regex = r'\s*Step\s+(?P<step>[0-9]+).*\s+timestep\s+(?P<timestep>' + floating_point_regex + r')'
 
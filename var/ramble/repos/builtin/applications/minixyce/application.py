@@ -30,27 +30,17 @@ class Minixyce(SpackApplication):
                template=['cp {minixyce}/doc/tests/{workload_name}.net {experiment_run_dir}/{workload_name}.net'],
                use_mpi=False)
 
-    executable('generate_RC_ladder',
-               template=['perl {minixyce}/doc/tests/RC_ladder.pl {num_ladder_stages} > {experiment_run_dir}/{workload_name}.net; echo Running perl'],
-               use_mpi=False)
-
-    executable('generate_RLC_ladder',
-               template=['perl {minixyce}/doc/tests/RLC_ladder.pl {num_ladder_stages} > {experiment_run_dir}/{workload_name}.net; echo Running perl'],
-               use_mpi=False)
-
-    executable('generate_RC_ladder2',
-               template=['perl {minixyce}/doc/tests/RC_ladder2.pl {num_ladder_stages} > {experiment_run_dir}/{workload_name}.net; echo Running perl'],
-               use_mpi=False)
-
-    executable('generate_RLC_ladder2',
-               template=['perl {minixyce}/doc/tests/RLC_ladder2.pl {num_ladder_stages} > {experiment_run_dir}/{workload_name}.net; echo Running perl'],
-               use_mpi=False)
+    rc_workloads = ['RC_ladder', 'RLC_ladder', 'RC_ladder2', 'RLC_ladder2']
+    for workload_name in rc_workloads:
+        executable('generate_' + workload_name,
+                   template=['perl {minixyce}/doc/tests/' + workload_name + '.pl {num_ladder_stages} > {experiment_run_dir}/{workload_name}.net; echo Running perl'],
+                   use_mpi=False)
 
     cir_workloads = ['cir1', 'cir2', 'cir3', 'cir4', 'cir5']
+    cir_executables = ('get_simple_network', 'execute')
     for cir_workload in cir_workloads:
-        workload(cir_workload, executables=['get_simple_network', 'execute'])
+        workload(cir_workload, executables=cir_executables)
 
-    rc_workloads = ['RC_ladder', 'RLC_ladder', 'RC_ladder2', 'RLC_ladder2']
     for workload_name in rc_workloads:
         workload(workload_name, executables=['generate_' + workload_name, 'execute'])
 
@@ -70,7 +60,10 @@ class Minixyce(SpackApplication):
 
     result_regex = r'.*\s+(?P<num_iters>[0-9]+)\s+(?P<num_restarts>[0-9]+)'
 
-    floating_point_regex = r'[\+\-]*[0-9]*\.*[0-9]+E*[\+\-]*[0-9]*'
+    # Each part of a number can only be matched one way, which avoids
+    # catastrophic backtracking on long lines of numbers. Fortran drops the
+    # 'E' from 3-digit exponents (e.g. 0.1234-100), so that form is accepted.
+    floating_point_regex = r'[\+\-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[Ee][\+\-]?[0-9]+|[\+\-][0-9]+)?'
 
     success_regex = r'^\s*TIME.*num_GMRES_iters\s*num_GMRES_restarts'
     success_criteria('valid', mode='string',
@@ -95,7 +88,7 @@ class Minixyce(SpackApplication):
                     units=''
                     )
 
-    state_var_regex = r'\s*(?P<State_Variable>[0-9]+)*:*\s*(?P<name>[0-9A-Za-z]+)\s*=\s*(?P<value>' + floating_point_regex + r')'
+    state_var_regex = r'\s*(?:(?P<State_Variable>[0-9]+):)?\s*(?P<name>[0-9A-Za-z]+)\s*=\s*(?P<value>' + floating_point_regex + r')'
 
     figure_of_merit('Name', log_file=processed_output,
                     fom_regex=state_var_regex,
@@ -125,6 +118,7 @@ class Minixyce(SpackApplication):
                 f.write(setting + ' = ' + self.expander.expansion_str(setting) + '\n')
 
     def _analyze_experiments(self, workspace):
+        import collections
         import os
 
         output_file = self.expander.expand_var('{experiment_run_dir}/{workload_name}_tran_results.prn')
@@ -134,7 +128,9 @@ class Minixyce(SpackApplication):
             names = []
             with open(output_file, 'r') as f:
                 names = f.readline().split()
-                for line in (f.readlines()[-1:]):
+                # Only the last time step is needed, so stream through the
+                # file instead of reading every line into memory
+                for line in collections.deque(f, maxlen=1):
                     values = line.split()
 
             with open(processed_output_path, 'w+') as f: